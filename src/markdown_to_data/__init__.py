@@ -2,8 +2,11 @@
 markdown_to_data - Convert markdown and its elements (tables, lists, code, etc.) into structured, easily processable data formats like lists and hierarchical dictionaries (or JSON), with support for parsing back to markdown.
 """
 
-from .markdown_to_data import Markdown
-from .to_md.to_md_parser import to_md_parser
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .markdown_to_data import Markdown
+    from .to_md.to_md_parser import to_md_parser
 
 __all__ = [
     'Markdown',
@@ -11,3 +14,18 @@ __all__ = [
 ]
 
 __version__ = "1.0.0"
+
+# Public names and the modules they are imported from on first access, so importing a
+# submodule (e.g. a single merging step) doesn't load the whole parsing pipeline
+_LAZY_IMPORTS = {
+    'Markdown': '.markdown_to_data',
+    'to_md_parser': '.to_md.to_md_parser'
+}
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,101 @@
-from typing import List, Dict, Any, Literal, Text
+from typing import List, Dict, Any, Literal, Text, Tuple, NamedTuple
+from collections import OrderedDict, defaultdict
+from array import array
+from threading import Lock
+from itertools import islice
 import json
 
 # TO PYTHON
-from .to_python.classification.classification import md_classification
+from .to_python.classification.classification import classify_lines
 from .to_python.to_python_objects import merge_classified_markdown_lines, hierarchy_with_merged_markdown_lines
 # TO MD
 from .to_md.to_md_parser import to_md_parser
 from .to_md.md_elements_list import MDElements
 
+# Immutable products (md_elements, to_md and to_json output) of recently parsed markdown
+# texts, shared across `Markdown` instances with the same text (LRU)
+_PRODUCTS_CACHE: 'OrderedDict[str, Dict[Any, Any]]' = OrderedDict()
+_PRODUCTS_CACHE_SIZE = 128
+
+# Guards the cache and the last looked up entry, as instances are parsed from several threads
+_PRODUCTS_LOCK = Lock()
+
+# Single slot holding the last looked up markdown text and its entry. The text is held,
+# so an identity check can't match a different string reusing the address
+_LAST_PRODUCTS: Tuple[str | None, Dict[Any, Any]] = (None, {})
+
+def _cached_products(markdown: str) -> Dict[Any, Any]:
+    """Get the cache entry for the products of `markdown`, creating it if necessary."""
+    global _LAST_PRODUCTS
+    with _PRODUCTS_LOCK:
+        last_markdown, products = _LAST_PRODUCTS
+        if last_markdown is markdown:
+            return products
+
+        cached = _PRODUCTS_CACHE.get(markdown)
+        if cached is None:
+            products = _PRODUCTS_CACHE[markdown] = {}
+            if len(_PRODUCTS_CACHE) > _PRODUCTS_CACHE_SIZE:
+                _PRODUCTS_CACHE.popitem(last=False)
+        else:
+            products = cached
+            _PRODUCTS_CACHE.move_to_end(markdown)
+        _LAST_PRODUCTS = (markdown, products)
+        return products
+
+# Field holding the variant of the element types which have variants
+_VARIANT_FIELDS = {
+    'list': 'type',  # 'ul' or 'ol'
+    'code': 'language'  # language type or None
+}
+# Variants of all element types without variants, shared by the cached md_elements
+_NO_VARIANTS: frozenset = frozenset()
+
+class _ElementInfo(NamedTuple):
+    """Cached count, positions and variants of one markdown element type."""
+    element_count: int
+    positions: 'array[int]'
+    variants: frozenset
+
+def _build_md_elements(md_list: List[Dict[str, Any]]) -> Dict[str, _ElementInfo]:
+    """
+    Collect count, positions and variants of each markdown element type in `md_list`.
+    The result is kept in the cache, so each type is stored as a compact immutable `_ElementInfo`
+    with the positions packed into an int array and the variants frozen.
+    """
+    # Collect positions and variants per element type in one pass, counts follow from the positions
+    positions: Dict[str, 'array[int]'] = defaultdict(lambda: array('i'))
+    variants: Dict[str, set] = defaultdict(set)
+    for position, item in enumerate(md_list):
+        for key in item:
+            positions[key].append(position)
+
+            # Collect specific variants/types
+            variant_field = _VARIANT_FIELDS.get(key)
+            if variant_field is not None:
+                variants[key].add(item[key][variant_field])
+
+    return {
+        key: _ElementInfo(
+            len(key_positions), key_positions, frozenset(variants[key]) if key in variants else _NO_VARIANTS
+        )
+        for key, key_positions in positions.items()
+    }
+
+def _copy_md_elements(elements_info: Dict[str, _ElementInfo]) -> Dict[str, Any]:
+    """
+    Build the md_elements dictionaries from the cached element infos, so cached entries are never shared with callers.
+    The positions are unpacked into lists.
+    """
+    return {
+        key: {
+            'count': info.element_count,
+            'positions': info.positions.tolist(),
+            'variants': set(info.variants)
+        }
+        for key, info in elements_info.items()
+    }
+
 class Markdown:
     """
     A class for parsing markdown text into structured data formats and back to markdown.
@@ -19,6 +107,10 @@ class Markdown:
     4. Extract specific markdown building blocks
 
     The class uses lazy loading for its properties, computing them only when first accessed.
+    The string outputs and `md_elements` are cached per markdown text, so instances created
+    for the same text reuse them instead of parsing again. Once `classified_lines`, `md_list`
+    or `md_dict` is handed out, the caller may change the returned data, so the string outputs
+    of that instance are built from its own data on each call.
 
     Attributes:
         classified_lines (List[Dict]): Raw classification of markdown lines with type and indentation information
@@ -80,31 +172,155 @@ class Markdown:
         - to_md_parser: For direct conversion of markdown data structures to text
         - MDElements: For list of supported markdown element types
     """
+    # Instances only hold the text, its lazily built outputs and the shared products cache
+    # entry, all the parsing machinery is module level and shared by all instances
+    __slots__ = (
+        '_markdown', '_pending_text', '_classified_lines', '_md_list', '_md_dict', '_md_elements', '_products',
+        '_handed_out', '_committed', '__weakref__'
+    )
+
     def __init__(self, markdown: str):
-        self._markdown = markdown
+        # Key of the shared products cache entry, None once extended
+        self._markdown: str | None = markdown
+        # Text after the committed lines, in the chunks passed to `extend`
+        self._pending_text: List[str] = [markdown]
+        self._classified_lines: List[Dict[str, Any]] | None = None
+        self._md_list: List[Dict[str, Any]] | None = None
+        self._md_dict: Dict[str, Any] | None = None
+        self._md_elements: Dict[str, Any] | None = None
+        # Products cache entry, looked up on first use
+        self._products: Dict[Any, Any] | None = None
+        # Whether classified_lines, md_list or md_dict was handed out to the caller
+        self._handed_out = False
+        # Classification state after the last complete line: classified lines, in_code and index_of_line
+        self._committed: Tuple[List[Dict[str, Any]], bool, int] | None = None
+
+    def _get_classified_lines(self) -> List[Dict[str, Any]]:
+        if self._classified_lines is None:
+            self._classified_lines = self._classify()
+        return self._classified_lines
+
+    @property
+    def classified_lines(self):
+        # Handed out without parsing further, md_elements shared later are built from a private parse
+        self._handed_out = True
+        return self._get_classified_lines()
+
+    def _classify(self) -> List[Dict[str, Any]]:
+        '''
+        Classify the markdown line by line, continuing after the lines committed by an earlier classification.
+        Complete lines are committed, as text appended by `extend` can't change their classification,
+        and only the text after them is kept.
+        '''
+        # Joining a single chunk returns it without copying
+        markdown = ''.join(self._pending_text)
+        if self._committed is None:
+            stripped_markdown = markdown.lstrip() # delete whitespace from beginning
+            if not stripped_markdown:
+                # Nothing to commit, as appended text gets stripped as well
+                return []
+            classified_list: List[Dict[str, Any]] = []
+            in_code, index_of_line, offset = False, -1, len(markdown) - len(stripped_markdown)
+        else:
+            committed_list, in_code, index_of_line = self._committed
+            classified_list = list(committed_list)
+            offset = 0
+
+        pending = markdown[offset:]
+        lines = pending.splitlines()
+        # The last line is incomplete without a line break, and a trailing '\r' may still become '\r\n'.
+        # Only the last character is checked, so the lines are split once without their breaks.
+        last_char = pending[-1:]
+        committed_count = len(lines)
+        if lines and (last_char == '\r' or last_char.splitlines() != ['']):
+            committed_count -= 1
+            # Everything before the incomplete line and its trailing '\r' is committed
+            offset += len(pending) - len(lines[-1]) - (last_char == '\r')
+        else:
+            offset += len(pending)
+
+        in_code, index_of_line = classify_lines(
+            islice(lines, committed_count), classified_list,
+            inline_classification=True, in_code=in_code, index_of_line=index_of_line
+        )
+        self._committed = (list(classified_list), in_code, index_of_line)
+        self._pending_text = [markdown[offset:]] if offset < len(markdown) else []
+
+        classify_lines(
+            lines[committed_count:], classified_list,
+            inline_classification=True, in_code=in_code, index_of_line=index_of_line
+        )
+        return classified_list
+
+    def extend(self, text: str) -> None:
+        '''
+        Append text to the markdown, e.g. while it is streamed.
+
+        Lines which were complete before are not classified again, the classification continues
+        with the last incomplete line. All other outputs are built again on next access.
+
+        Args:
+            text: Markdown text to append
+        '''
+        # Only collected, the chunks are joined on the next classification. The full text isn't kept,
+        # so the products are cached for this instance only
+        self._pending_text.append(text)
+        self._markdown = None
         self._classified_lines = None
         self._md_list = None
         self._md_dict = None
         self._md_elements = None
+        self._products = None
+        self._handed_out = False
 
-    @property
-    def classified_lines(self):
-        if self._classified_lines is None:
-            self._classified_lines = md_classification(markdown=self._markdown, inline_classification=True) #md_line_classification(self._markdown)
-        return self._classified_lines
+    def _get_products(self) -> Dict[Any, Any]:
+        if self._products is None:
+            self._products = _cached_products(self._markdown) if self._markdown is not None else {}
+        return self._products
 
-    @property
-    def md_list(self):
+    def _get_md_list(self) -> List[Dict[str, Any]]:
         if self._md_list is None:
-            self._md_list = merge_classified_markdown_lines(classified_list=self.classified_lines) # final_md_data_as_list(self.classified_lines)
+            self._md_list = merge_classified_markdown_lines(classified_list=self._get_classified_lines()) # final_md_data_as_list(self.classified_lines)
         return self._md_list
 
-    @property
-    def md_dict(self):
+    def _get_md_dict(self) -> Dict[str, Any]:
         if self._md_dict is None:
-            self._md_dict = hierarchy_with_merged_markdown_lines(self.md_list)
+            self._md_dict = hierarchy_with_merged_markdown_lines(self._get_md_list())
         return self._md_dict
 
+    def _get_md_elements_info(self) -> Dict[str, _ElementInfo]:
+        products = self._get_products()
+        elements_info = products.get('md_elements')
+        if elements_info is None:
+            if self._handed_out and self._markdown is not None:
+                # Only classified_lines was handed out, which the caller may have changed,
+                # so the shared entry is built from a private parse
+                md_list = Markdown(self._markdown)._get_md_list()
+            else:
+                md_list = self._get_md_list()
+            elements_info = products['md_elements'] = _build_md_elements(md_list)
+        return elements_info
+
+    def _hand_out(self) -> None:
+        '''
+        Mark the parsed data as handed out to the caller, who may change it (md_dict shares the data of md_list).
+        From now on, the string outputs are built on each call. The cached md_elements are built before,
+        while the data is still private.
+        '''
+        if not self._handed_out:
+            self._get_md_elements_info()
+            self._handed_out = True
+
+    @property
+    def md_list(self):
+        self._hand_out()
+        return self._get_md_list()
+
+    @property
+    def md_dict(self):
+        self._hand_out()
+        return self._get_md_dict()
+
     @property
     def md_elements(self):
         '''
@@ -121,26 +337,7 @@ class Markdown:
                     - Empty set() for elements without variants
         '''
         if self._md_elements is None:
-            elements_info = {}
-            for item in self.md_list:
-                for key in item.keys():
-                    if key not in elements_info:
-                        elements_info[key] = {
-                            'count': 0,
-                            'positions': [],
-                            'variants': set()
-                        }
-
-                    elements_info[key]['count'] += 1
-                    elements_info[key]['positions'].append(self.md_list.index(item))
-
-                    # Collect specific variants/types
-                    if key == 'list':
-                        elements_info[key]['variants'].add(item[key]['type'])  # 'ul' or 'ol'
-                    elif key == 'code':
-                        elements_info[key]['variants'].add(item[key]['language'])  # language type or None
-
-            self._md_elements = elements_info
+            self._md_elements = _copy_md_elements(self._get_md_elements_info())
         return self._md_elements
 
     # TODO: needs reworks
@@ -167,13 +364,29 @@ class Markdown:
         0 spacer means not empty lines.
         2 spacer means 2 empty lines.
         '''
-        return to_md_parser(data=self.md_list, include=include, exclude=exclude, spacer=spacer)
+        if self._handed_out:
+            return to_md_parser(data=self._get_md_list(), include=include, exclude=exclude, spacer=spacer)
+
+        # Markdown output is cached per markdown text and combination of arguments
+        products = self._get_products()
+        key = ('to_md', tuple(include), tuple(exclude) if exclude is not None else None, spacer)
+        if key not in products:
+            products[key] = to_md_parser(data=self._get_md_list(), include=include, exclude=exclude, spacer=spacer)
+        return products[key]
 
     def to_json(self, indent: int | str | None = None): # TODO: necessary?
         '''
         Convert the dictionary `markdown_dict` into JSON.
         '''
-        return json.dumps(obj=self.md_dict, indent=indent)
+        if self._handed_out:
+            return json.dumps(obj=self._get_md_dict(), indent=indent)
+
+        # JSON output is cached per markdown text and indent
+        products = self._get_products()
+        key = ('to_json', indent)
+        if key not in products:
+            products[key] = json.dumps(obj=self._get_md_dict(), indent=indent)
+        return products[key]
 
 
     # TODO: 'checked', 'unchecked' to exclude checked or unchecked task list elements
@@ -4,26 +4,36 @@ class BlockquoteItem(TypedDict):
     content: str
     items: List['BlockquoteItem']
 
-def process_blockquote_item(item: BlockquoteItem, level: int = 1) -> List[str]:
+def process_blockquote_item(item: BlockquoteItem, level: int = 1, result: List[str] | None = None) -> List[str]:
     """
-    Process a blockquote item and its nested items recursively.
+    Process a blockquote item and its nested items depth first.
 
     Args:
         item: Dictionary containing 'content' and 'items' fields
         level: Current nesting level (default: 1)
+        result: List the lines are appended to, so each line is only added once
+            instead of being copied up through every level (default: new list)
 
     Returns:
         List of properly formatted markdown lines
     """
-    result = []
-    prefix = '>' * level + ' '
-
-    # Add the current item's content
-    result.append(f"{prefix}{item['content']}")
-
-    # Process nested items if any
-    for nested_item in item['items']:
-        result.extend(process_blockquote_item(nested_item, level + 1))
+    if result is None:
+        result = []
+
+    # Explicit stack of the sibling lists still being written, each with its level and line prefix,
+    # so the prefix is built once per list and no frame is allocated per nesting level
+    stack = [(level, '>' * level + ' ', iter((item,)))]
+    while stack:
+        level, prefix, siblings = stack[-1]
+        for sibling in siblings:
+            result.append(f"{prefix}{sibling['content']}")
+            nested_items = sibling['items']
+            if nested_items:
+                # Continue with this list once the nested items are written
+                stack.append((level + 1, '>' * (level + 1) + ' ', iter(nested_items)))
+                break
+        else:
+            stack.pop()
 
     return result
 
@@ -40,8 +50,8 @@ def blockquote_data_to_md(data: Dict[str, Any]) -> Text:
     if 'blockquote' not in data:
         return ''
 
-    result = []
+    result: List[str] = []
     for item in data['blockquote']:
-        result.extend(process_blockquote_item(item))
+        process_blockquote_item(item, result=result)
 
     return '\n'.join(result) + '\n'
@@ -2,10 +2,10 @@ from typing import Dict, Any, Text
 
 def code_data_to_md(data: Dict[str, Any]) -> Text:
     """Convert code block data to markdown format."""
-    if not isinstance(data, dict) or 'code' not in data:
+    if not isinstance(data, dict):
         return ''
 
-    code_data = data['code']
+    code_data = data.get('code')
 
     # Validate code structure
     # TODO: could be pydantic model
@@ -16,11 +16,13 @@ def code_data_to_md(data: Dict[str, Any]) -> Text:
 
     # Get the language specification (if any)
     language = code_data['language']
-    content = str(code_data['content'])
+    content = code_data['content']
+    if type(content) is not str:
+        content = str(content)
 
-    # Format the code block
-    # If language is None, convert it to empty string
-    language = '' if language is None else str(language)
-
-    # Construct the code block
+    # Construct the code block, the common None and str languages are formatted as they are
+    if language is None:
+        return f"```\n{content}\n```"
+    if type(language) is not str:
+        language = str(language)
     return f"```{language}\n{content}\n```"
@@ -11,9 +11,6 @@ def definition_list_data_to_md(data: Dict[str, Any]) -> Text:
     if not isinstance(definitions, list):
         return ''
 
-    # Format the term and definitions
-    result = [term]  # Start with the term
-    # Add each definition with the ':' prefix
-    result.extend(f": {definition}" for definition in definitions)
-
-    return '\n'.join(result)
+    # Format the term followed by each definition on its own line with the ': ' prefix,
+    # joined in a single pass from a list comprehension
+    return term + ''.join([f"\n: {definition}" for definition in definitions])
@@ -1,5 +1,8 @@
 from typing import Dict, Any, Text, TypedDict
 
+# Header marks by level, looked up instead of built for every header
+_HASHES = ('', '#', '##', '###', '####', '#####', '######')
+
 class HeaderContent(TypedDict):
     level: int
     content: str
@@ -51,12 +54,9 @@ def header_data_to_md(data: Dict[str, Any]) -> Text:
     content = header_data['content']
 
     # Validate level
-    if not isinstance(level, int) or level < 1 or level > 6:
+    if not isinstance(level, int) or not 1 <= level <= 6:
         return ''
 
-    # Convert level to markdown header syntax
-    header_marks = '#' * level
-
     # Format header with content
     # Ensure content is converted to string and stripped of leading/trailing whitespace
-    return f"{header_marks} {str(content).strip()}\n"
+    return f"{_HASHES[level]} {str(content).strip()}\n"
@@ -1,20 +1,14 @@
 from typing import Dict, Any, Text, List
 
-def _get_task_marker(task: str | None) -> str:
-    """Get the appropriate task list marker."""
-    if task == 'checked':
-        return '[x]'
-    elif task == 'unchecked':
-        return '[ ]'
-    return ''
-
-def _get_list_marker(list_type: str, index: int = 1) -> str:
-    """Get the appropriate list marker based on list type."""
-    return f"{index}. " if list_type == 'ol' else "- "
+# Task list markers by task status, followed by a space. Other statuses, like None, get no marker
+_TASK_MARKERS = {'checked': '[x] ', 'unchecked': '[ ] '}
+
+# Ordered list markers by number, built once and shared by every list. Longer lists fall back to formatting
+_ORDERED_MARKERS = tuple(f'{number}. ' for number in range(1024))
 
 def _process_list_items(items: List[Dict[str, Any]], list_type: str, indent_level: int = 0) -> List[str]:
     """
-    Process list items recursively and return formatted strings.
+    Process list items and their nested items depth first and return formatted strings.
 
     Args:
         items: List of item dictionaries containing content and nested items
@@ -24,30 +18,33 @@ def _process_list_items(items: List[Dict[str, Any]], list_type: str, indent_leve
     Returns:
         List of formatted markdown strings
     """
-    result = []
-
-    for index, item in enumerate(items, 1):
-        # Calculate indentation
-        indent = "    " * indent_level
-
-        # Get list marker and task marker
-        list_marker = _get_list_marker(list_type, index)
-        #task_marker = _get_task_marker(item.get('task'))
-        task_marker = _get_task_marker(item['task'])
-
-        # Add space only when there's a task marker
-        spacer = " " if task_marker else ""
-        line = f"{indent}{list_marker}{task_marker}{spacer}{item['content']}"
-        result.append(line)
-
-        # Process nested items if they exist
-        if item['items']:
-            nested_results = _process_list_items(
-                items=item['items'],
-                list_type=list_type,  # maintain same list type for nested items
-                indent_level=indent_level + 1
-            )
-            result.extend(nested_results)
+    result: List[str] = []
+    ordered = list_type == 'ol'
+
+    # Explicit stack of the item lists still being written, each with its indentation level, line prefix and
+    # numbering, so nested lines are appended once instead of being copied up through every level.
+    # The prefix is built once per list: the indentation, plus the bullet for unordered lists
+    stack = [(indent_level, "    " * indent_level if ordered else "    " * indent_level + "- ", enumerate(items, 1))]
+    while stack:
+        indent_level, prefix, siblings = stack[-1]
+        for index, item in siblings:
+            # Get task marker, with a space only when there's a task marker
+            task_marker = _TASK_MARKERS.get(item['task'], '')
+
+            # Ordered lists are numbered per nesting level
+            if ordered:
+                marker = _ORDERED_MARKERS[index] if index < 1024 else f'{index}. '
+                result.append(f"{prefix}{marker}{task_marker}{item['content']}")
+            else:
+                result.append(f"{prefix}{task_marker}{item['content']}")
+
+            # Process nested items if they exist, nested items maintain the same list type
+            if item['items']:
+                nested_prefix = "    " * (indent_level + 1) if ordered else "    " * (indent_level + 1) + "- "
+                stack.append((indent_level + 1, nested_prefix, enumerate(item['items'], 1)))
+                break
+        else:
+            stack.pop()
 
     return result
 
@@ -1,16 +1,18 @@
 from typing import Dict, Any, Text
-import re
 
 def _needs_quotes(value: str) -> bool:
-    """Determine if a string value needs quotes."""
-    special_chars = [':', ',', '#']  # Add more special characters if needed
-    return (any(char in value for char in special_chars) and
+    """
+    Determine if a string value needs quotes.
+    Values with a special character (':', ',' or '#'), which includes URLs, need quotes unless already quoted.
+    """
+    # Chained membership tests, each scanning in C without a generator per value
+    return ((':' in value or ',' in value or '#' in value) and
             not (value.startswith('"') and value.endswith('"')) and
             not (value.startswith("'") and value.endswith("'")))
 
 def _transform_key(key: str) -> str:
     """Transform key from Python format to markdown format."""
-    return re.sub(r'_', ' ', key)
+    return key.replace('_', ' ')
 
 def format_metadata_value(value: Any) -> str:
     """Format different types of metadata values."""
@@ -28,19 +30,15 @@ def format_metadata_value(value: Any) -> str:
             return '[]'
 
         if all(isinstance(x, (int, float)) for x in value):
-            return ', '.join(str(x) for x in value)
+            return ', '.join(map(str, value))
 
         if all(isinstance(x, str) for x in value):
-            formatted_items = []
-            for item in value:
-                if _needs_quotes(item):
-                    formatted_items.append(f'"{item}"')
-                else:
-                    formatted_items.append(item)
-
-            if any('"' in item for item in formatted_items):
-                return f'[{", ".join(formatted_items)}]'
-            return ', '.join(formatted_items)
+            joined = ', '.join([f'"{item}"' if _needs_quotes(item) else item for item in value])
+
+            # The separator holds no quotes, so any quote in the joined string comes from an item
+            if '"' in joined:
+                return f'[{joined}]'
+            return joined
 
         return str(value)
 
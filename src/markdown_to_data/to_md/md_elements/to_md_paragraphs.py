@@ -2,11 +2,18 @@ from typing import Dict, Any, Text, Union
 
 def paragraph_data_to_md(data: Union[Dict[str, Any], str]) -> Text:
     """Convert paragraph data to markdown format."""
+    # Fast path for the common dictionary with a string paragraph
+    if type(data) is dict:
+        if 'paragraph' not in data:
+            return ''
+        paragraph = data['paragraph']
+        return paragraph if type(paragraph) is str else str(paragraph)
+
     # Handle direct string input
     if isinstance(data, str):
         return data
 
-    # Handle dictionary input
+    # Handle dictionary subclasses
     if isinstance(data, dict) and 'paragraph' in data:
         return str(data['paragraph'])
 
@@ -1,64 +1,19 @@
 from typing import Dict, List, Any, Text
 
-def transpose_table_data(data: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+def _column_cells(header: Any, values: List[Any], num_rows: int) -> List[str]:
     """
-    Transform column-based table data to row-based format.
+    Convert the header and the values of a column to padded cells.
 
-    Args:
-        data: Dictionary with columns as keys and value lists
-
-    Returns:
-        List of dictionaries, each representing a row
-    """
-    if not data:
-        return []
-
-    # Get number of rows from length of any column
-    num_rows = len(next(iter(data.values())))
-
-    # Create list of row dictionaries
-    rows = []
-    for i in range(num_rows):
-        row = {}
-        for col_name, col_values in data.items():
-            row[col_name] = col_values[i] if i < len(col_values) else None
-        rows.append(row)
-
-    return rows
-
-def calculate_column_widths(
-    headers: List[str],
-    rows: List[Dict[str, Any]]
-) -> Dict[str, int]:
-    """
-    Calculate required width for each column.
+    Every value is converted to a string once, both for measuring the column width and for the
+    cell itself. Columns shorter than the table are filled up with None.
     """
-    widths = {header: len(str(header)) for header in headers}
-
-    for row in rows:
-        for header in headers:
-            value = str(row.get(header, ''))
-            widths[header] = max(widths[header], len(value))
-
-    # Add padding
-    return {k: v + 2 for k, v in widths.items()}
+    cells = [str(header)]
+    cells.extend(value if type(value) is str else str(value) for value in values[:num_rows])
+    cells.extend(['None'] * (num_rows + 1 - len(cells)))
 
-def format_row(
-    row: Dict[str, Any],
-    headers: List[str],
-    widths: Dict[str, int]
-) -> str:
-    """Format a single table row."""
-    cells = []
-    for header in headers:
-        value = str(row.get(header, ''))
-        padding = widths[header] - len(value)
-        cells.append(f" {value}{' ' * (padding - 1)}")
-    return f"|{'|'.join(cells)}|"
-
-def create_separator(headers: List[str], widths: Dict[str, int]) -> str:
-    """Create separator row."""
-    return '|' + '|'.join('-' * width for width in widths.values()) + '|'
+    # Cells are padded to the widest cell, the spaces around them are added when joining the row
+    width = max(map(len, cells))
+    return [cell.ljust(width) for cell in cells]
 
 def table_data_to_md(data: Dict[str, Any]) -> Text:
     """
@@ -77,26 +32,20 @@ def table_data_to_md(data: Dict[str, Any]) -> Text:
     if not table_data:
         return ''
 
-    # Get headers (column names)
-    headers = list(table_data.keys())
-
-    # Transform to row-based format
-    rows = transpose_table_data(table_data)
-    if not rows:
+    # Get number of rows from length of any column
+    num_rows = len(next(iter(table_data.values())))
+    if not num_rows:
         return ''
 
-    # Calculate column widths
-    widths = calculate_column_widths(headers, rows)
-
-    # Create header row
-    header_row = format_row(dict(zip(headers, headers)), headers, widths)
+    # Build the padded cells column by column
+    columns = [_column_cells(header, values, num_rows) for header, values in table_data.items()]
 
-    # Create separator row
-    separator_row = create_separator(headers, widths)
+    # Create separator row, spanning the cells and the spaces around them
+    separator_row = '|' + '|'.join(['-' * (len(cells[0]) + 2) for cells in columns]) + '|'
 
-    # Create data rows
-    data_rows = [format_row(row, headers, widths) for row in rows]
+    # Create header and data rows by reading the columns row by row
+    rows = [f"| {' | '.join(row)} |" for row in zip(*columns)]
+    rows.insert(1, separator_row)
 
     # Combine all parts with newlines
-    table_parts = [header_row, separator_row] + data_rows
-    return '\n'.join(table_parts) + '\n'
+    return '\n'.join(rows) + '\n'
@@ -25,6 +25,22 @@ from .md_elements.to_md_tables import table_data_to_md
 from .md_elements.to_md_headers import header_data_to_md, get_header_level_type
 from .md_elements.to_md_separator import separator_data_to_md
 
+# Mapping of element types to their parser functions, built once instead of per call
+_PARSER_MAP = {
+    'header': header_data_to_md,
+    'metadata': metadata_data_to_md,
+    'paragraph': paragraph_data_to_md,
+    'blockquote': blockquote_data_to_md,
+    'list': list_data_to_md,
+    'def_list': definition_list_data_to_md,
+    'code': code_data_to_md,
+    'table': table_data_to_md,
+    'separator': separator_data_to_md
+}
+
+# Header types, headers are included or excluded by the type of their level
+_HEADER_TYPES = get_args(HeaderTypes)
+
 def to_md_parser(
     data: List[Dict[str, Any]],
     include: List[MDElements | int] = ['all'],
@@ -71,23 +87,11 @@ def to_md_parser(
     if exclude and 'all' in exclude:
         return ''
 
-    # Create mapping of element types to their parser functions
-    parser_map = {
-        'metadata': metadata_data_to_md,
-        'paragraph': paragraph_data_to_md,
-        'blockquote': blockquote_data_to_md,
-        'list': list_data_to_md,
-        'def_list': definition_list_data_to_md,
-        'code': code_data_to_md,
-        'table': table_data_to_md,
-        'separator': separator_data_to_md
-    }
-
-    # Headers are handled specially due to multiple types
-    header_types = list(get_args(HeaderTypes))
+    # Checked once instead of scanning `include` for every element
+    include_all = 'all' in include
 
     # Separate indices and element types for include/exclude
-    included_indices = {i for i in include if isinstance(i, int)} if 'all' not in include else set()
+    included_indices = {i for i in include if isinstance(i, int)} if not include_all else set()
     included_elements = {e for e in include if isinstance(e, str)}
 
     excluded_indices = {i for i in exclude if isinstance(i, int)} if exclude else set()
@@ -95,11 +99,11 @@ def to_md_parser(
 
     # Update excluded elements if 'headers' is in the set
     if 'headers' in excluded_elements:
-        excluded_elements.update(header_types)
+        excluded_elements.update(_HEADER_TYPES)
 
     # Update included elements if 'headers' is in the set
     if 'headers' in included_elements:
-        included_elements.update(header_types)
+        included_elements.update(_HEADER_TYPES)
 
     # Process each item in the data list
     valid_elements = []
@@ -109,41 +113,25 @@ def to_md_parser(
             continue
 
         element_type = next(iter(item))
+        parser = _PARSER_MAP.get(element_type)
+        if parser is None:
+            continue
 
-        # Special handling for headers
+        # Headers are included or excluded by their level type (h1-h6), other elements by their type
         if element_type == 'header':
-            header_level = item['header']['level']
-            header_type = get_header_level_type(header_level)
-
-            # Check if this header level should be excluded
-            if (idx in excluded_indices or
-                header_type in excluded_elements or
-                'headers' in excluded_elements):
-                continue
-
-            # Check if this header level should be included
-            if 'all' not in include and not (
-                idx in included_indices or
-                header_type in included_elements or
-                'headers' in included_elements):
-                continue
-
-            parsed_content = header_data_to_md(item)
-
-        # Handle other elements
-        elif element_type in parser_map:
-            if idx in excluded_indices or element_type in excluded_elements:
-                continue
-
-            if 'all' not in include and not (
-                idx in included_indices or
-                element_type in included_elements):
-                continue
-
-            parsed_content = parser_map[element_type](item)
+            block_type = get_header_level_type(item['header']['level'])
         else:
+            block_type = element_type
+
+        if idx in excluded_indices or block_type in excluded_elements:
+            continue
+
+        if not include_all and not (
+            idx in included_indices or
+            block_type in included_elements):
             continue
 
+        parsed_content = parser(item)
         if parsed_content:
             valid_elements.append(parsed_content)
 
@@ -1,6 +1,5 @@
-from typing import Text, Any, List, Dict
+from typing import Text, Any, List, Dict, Iterable, Tuple
 
-from .md_classification.classify_md_code import set_line_keys_to_code
 from .md_classification.classify_md_list import is_ordered_list_item, is_unordered_list_item
 from .md_classification.classify_md_paragraph import is_paragraph
 from .md_classification.classify_md_blockquote import is_blockquote
@@ -9,39 +8,74 @@ from .md_classification.classify_md_separator import is_separator
 from .md_classification.classify_md_table_row import is_table_row
 from .md_classification.classify_md_definition_list import is_definition_list_item
 
-from .line_content_classification import classify_line_content
+from .line_content_classification import classify_content
 
-def classify_markdown_line_by_line(markdown: Text) -> List[Dict[str, Any]]:
+# Leading characters a line needs to be a candidate for the respective element.
+# Lines not starting with one of them skip the check entirely.
+_SEPARATOR_MARKERS = frozenset('-*_')
+_UNORDERED_LIST_MARKERS = frozenset('-*+')
+_DIGITS = frozenset('0123456789')
+
+def classify_markdown_line_by_line(markdown: Text, inline_classification: bool = False) -> List[Dict[str, Any]]:
+    """
+    Classify markdown text line by line in a single pass.
+
+    Args:
+        markdown (Text): Raw markdown text to be classified
+        inline_classification (bool): Whether to classify the content of list items and blockquotes
+            as header or paragraph while walking the lines. Defaults to False.
+
+    Returns:
+        List[Dict[str, Any]]: List of dictionaries containing classified markdown lines
+    """
 
     markdown = markdown.lstrip() # delete whitespace from beginning
     lines: List[Text] = markdown.splitlines()
     classified_list: List[Dict[str, Any]] = []
 
-    # INDEX
+    classify_lines(lines, classified_list, inline_classification=inline_classification)
+
+    return classified_list
+
+def classify_lines(
+    lines: Iterable[Text],
+    classified_list: List[Dict[str, Any]],
+    inline_classification: bool = False,
+    in_code: bool = False,
     index_of_line: int = -1
-    # METADATA
-    #in_metadata: bool = False
-    #metadata: bool = False
-    # CODE
-    in_code: bool = False
+) -> Tuple[bool, int]:
+    """
+    Classify the lines and append them to `classified_list`, continuing the classification
+    of the lines already in there.
+
+    Args:
+        lines (Iterable[Text]): Lines to be classified, without line breaks
+        classified_list (List[Dict[str, Any]]): Classified lines preceding `lines`, extended in place
+        inline_classification (bool): Whether to classify the content of list items and blockquotes
+            as header or paragraph. Defaults to False.
+        in_code (bool): Whether the preceding lines ended inside a code block
+        index_of_line (int): Index of the last preceding line, -1 if there is none
 
+    Returns:
+        Tuple[bool, int]: `in_code` and `index_of_line` after the last line, to continue from
+    """
 
     for line in lines:
 
-        stripped_line = line.strip()
-        indent = len(line) - len(line.lstrip())
+        # Leading whitespace is scanned once for both the stripped line and the indent
+        lstripped_line = line.lstrip()
+        stripped_line = lstripped_line.rstrip()
+        indent = len(line) - len(lstripped_line)
 
         # CODE
         if stripped_line.startswith('```'):
             if in_code is False:
-                line = {'code': line, 'indent': indent}
-                classified_list.append(line)
+                classified_list.append({'code': line, 'indent': indent})
                 in_code = True
                 index_of_line += 1
             elif in_code is True:
-                line = {'code': line, 'indent': indent}
-                classified_list.append(line)
-                classified_list = set_line_keys_to_code(current_list=classified_list)
+                classified_list.append({'code': line, 'indent': indent})
+                # Lines inside the block were already classified as code while reading them
                 in_code = False
                 index_of_line += 1
             continue
@@ -53,18 +87,23 @@ def classify_markdown_line_by_line(markdown: Text) -> List[Dict[str, Any]]:
             index_of_line += 1
             continue
 
+        first_char = stripped_line[:1]
+
         # SEPARATOR
-        if is_separator(stripped_line):
+        if first_char in _SEPARATOR_MARKERS and is_separator(stripped_line):
             classified_list.append({'hr': '---', 'indent': indent})
             index_of_line += 1
             continue
 
         # UNORDERED LIST
-        is_ul, ul_value, ul_marker, ul_task, ul_item_indent, ul_marker_indent = is_unordered_list_item(stripped_line, line)
+        is_ul, ul_value, ul_marker, ul_task, ul_item_indent, ul_marker_indent = (
+            is_unordered_list_item(stripped_line, line) if first_char in _UNORDERED_LIST_MARKERS
+            else (False, '', '', None, 0, 0)
+        )
         if is_ul:
             classified_list.append({
                 'ul': {
-                    'li': ul_value,
+                    'li': classify_content(ul_value, indent=0) if inline_classification else ul_value,
                     'marker': ul_marker,
                     'task': ul_task
                 },
@@ -75,11 +114,14 @@ def classify_markdown_line_by_line(markdown: Text) -> List[Dict[str, Any]]:
             continue
 
         # ORDERED LIST
-        is_ol, ol_value, ol_marker, ol_task, ol_item_indent, ol_marker_indent = is_ordered_list_item(stripped_line, line)
+        is_ol, ol_value, ol_marker, ol_task, ol_item_indent, ol_marker_indent = (
+            is_ordered_list_item(stripped_line, line) if first_char in _DIGITS
+            else (False, '', '', None, 0, 0)
+        )
         if is_ol:
             classified_list.append({
                 'ol': {
-                    'li': ol_value,
+                    'li': classify_content(ol_value, indent=0) if inline_classification else ol_value,
                     'marker': ol_marker,
                     'task': ol_task
                 },
@@ -90,30 +132,35 @@ def classify_markdown_line_by_line(markdown: Text) -> List[Dict[str, Any]]:
             continue
 
         # HEADER or PARAGRAPH
-        if stripped_line.startswith('#'):
+        if first_char == '#':
             result = is_header_or_paragraph(stripped_line=stripped_line, line=line, indent=indent)
             classified_list.append(result)
             index_of_line += 1
             continue
 
         # TABLES
-        is_row, row_data = is_table_row(line)
+        is_row, row_data = is_table_row(line) if '|' in line else (False, {})
         if is_row:
             classified_list.append(row_data)
             index_of_line += 1
             continue
 
         # BLOCKQUOTES
-        is_bq, blockquote_dict = is_blockquote(line=line)
+        is_bq, blockquote_dict = is_blockquote(line=line) if first_char == '>' else (False, {})
         if is_bq:
+            if inline_classification:
+                blockquote_dict['blockquote'] = classify_content(blockquote_dict['blockquote'], indent=0)
             classified_list.append(blockquote_dict)
             index_of_line += 1
             continue
 
         # DEFINITION LISTS
-        previous_dict = (classified_list[-1] if classified_list and index_of_line > 0
-                        else {'p': line, 'indent': indent})
-        is_def_item, def_item_dict = is_definition_list_item(line, previous_dict)
+        if first_char == ':':
+            previous_dict = (classified_list[-1] if classified_list and index_of_line > 0
+                            else {'p': line, 'indent': indent})
+            is_def_item, def_item_dict = is_definition_list_item(line, previous_dict)
+        else:
+            is_def_item, def_item_dict = False, {}
 
         if is_def_item:
             if 'convert_previous' in def_item_dict:
@@ -131,7 +178,7 @@ def classify_markdown_line_by_line(markdown: Text) -> List[Dict[str, Any]]:
             classified_list.append(is_paragraph(line, indent))
             index_of_line += 1
 
-    return classified_list
+    return in_code, index_of_line
 
 def md_classification(markdown: Text, inline_classification: bool = True) -> List[Dict[str, Any]]:
     """
@@ -144,9 +191,4 @@ def md_classification(markdown: Text, inline_classification: bool = True) -> Lis
     Returns:
         List[Dict[str, Any]]: List of dictionaries containing classified markdown elements with their properties
     """
-    classified_md = classify_markdown_line_by_line(markdown=markdown)
-
-    if inline_classification:
-        classified_md = classify_line_content(classified_lines=classified_md)
-
-    return classified_md
+    return classify_markdown_line_by_line(markdown=markdown, inline_classification=inline_classification)
@@ -21,20 +21,12 @@ def is_blockquote(line: str) -> Tuple[bool, Dict[str, Any]]:
     if not stripped_line.startswith('>'):
         return False, {}
 
-    # Count consecutive '>' markers
+    # Count the '>' markers group by group, skipping whitespace between the groups
     level = 0
-    content_start = 0
-
-    for i, char in enumerate(stripped_line):
-        if char == '>':
-            level += 1
-            content_start = i + 1
-        elif char.isspace():
-            continue
-        else:
-            break
-
-    # Extract content after markers
-    content = stripped_line[content_start:].lstrip()
+    content = stripped_line
+    while content.startswith('>'):
+        markers_removed = content.lstrip('>')
+        level += len(content) - len(markers_removed)
+        content = markers_removed.lstrip()
 
     return True, {'blockquote': content, 'level': level}
@@ -1,15 +1,15 @@
 from typing import Dict, Any
-import re
 
 from .classify_md_paragraph import is_paragraph
 
+# Interned header keys by level, instead of formatting them for every header
+_HEADER_KEYS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
 def is_header_or_paragraph(stripped_line: str, line: str, indent: int) -> Dict[str, Any]:
     """Detect header line or paragraph."""
-    match = re.match(r'^(#+)\s+(.*)', stripped_line)
-    if match:
-        level = len(match.group(1))
-        header_text = match.group(2)
-        if level > 6:
-            return is_paragraph(line, indent)
-        return {f'h{level}': header_text, 'indent': indent}
+    # A header is a run of up to six '#' followed by whitespace
+    level = len(stripped_line) - len(stripped_line.lstrip('#'))
+    if 0 < level <= 6 and stripped_line[level:level + 1].isspace():
+        header_text = stripped_line[level:].lstrip()
+        return {_HEADER_KEYS[level - 1]: header_text, 'indent': indent}
     return is_paragraph(line, indent)
@@ -1,6 +1,8 @@
 import re
 from typing import Tuple
 
+_TASK_RE = re.compile(r'^\[([ xX])\](\s*)(.*)$')
+
 def is_unordered_list_item(stripped_line: str, line: str) -> Tuple[bool, str, str, str | None, int, int]:
     """
     Check if line is an unordered list item and return value, marker, task status, indent and marker_indent.
@@ -18,14 +20,12 @@ def is_unordered_list_item(stripped_line: str, line: str) -> Tuple[bool, str, st
             - item_indent: Total indentation to content
             - marker_indent: Indentation before marker
     """
-    markers = {'-', '*', '+'}
-
     # Get the initial indent before the marker
-    marker_indent = len(line) - len(line.lstrip())
     non_stripped_line = line.lstrip()
+    marker_indent = len(line) - len(non_stripped_line)
 
     # Check if remaining line starts with a marker
-    if not any(non_stripped_line.startswith(m) for m in markers):
+    if not non_stripped_line or non_stripped_line[0] not in '-*+':
         return False, '', '', None, 0, 0
 
     marker = non_stripped_line[0]
@@ -34,9 +34,9 @@ def is_unordered_list_item(stripped_line: str, line: str) -> Tuple[bool, str, st
     if len(non_stripped_line) < 2 or non_stripped_line[1] != ' ':
         return False, '', '', None, 0, 0
 
-    # Check for task list format
+    # Check for task list format, only content starting with a checkbox can be a task
     remaining_content = non_stripped_line[2:].lstrip()
-    task_match = re.match(r'^\[([ xX])\](\s*)(.*)$', remaining_content)
+    task_match = _TASK_RE.match(remaining_content) if remaining_content[:1] == '[' else None
 
     if task_match:
         status = 'checked' if task_match.group(1).lower() == 'x' else 'unchecked'
@@ -87,20 +87,28 @@ def is_ordered_list_item(stripped_line: str, line: str) -> Tuple[bool, str, str,
             - item_indent: Total indentation to content
             - marker_indent: Indentation before marker
     """
-    marker_indent = len(line) - len(line.lstrip())
     non_stripped_line = line.lstrip()
+    marker_indent = len(line) - len(non_stripped_line)
 
-    # Check for ordered list format
-    list_match = re.match(r'^(\d{1,9}[).])(\s+)(.+)$', non_stripped_line)
-    if not list_match:
+    # Check for ordered list format: 1-9 digits, ')' or '.', whitespace and content
+    digits = len(non_stripped_line) - len(non_stripped_line.lstrip('0123456789'))
+    if not 0 < digits < 10 or non_stripped_line[digits:digits + 1] not in ('.', ')'):
         return False, '', '', None, 0, 0
 
-    marker = list_match.group(1)
-    spaces_after_marker = list_match.group(2)
-    remaining_content = list_match.group(3)
+    marker = non_stripped_line[:digits + 1]
+    after_marker = non_stripped_line[digits + 1:]
+    remaining_content = after_marker.lstrip()
+    spaces_after_marker = after_marker[:len(after_marker) - len(remaining_content)]
+    if not spaces_after_marker:
+        return False, '', '', None, 0, 0
+    if not remaining_content:
+        # Whitespace only content: the last whitespace character is the content
+        if len(spaces_after_marker) < 2:
+            return False, '', '', None, 0, 0
+        spaces_after_marker, remaining_content = spaces_after_marker[:-1], spaces_after_marker[-1]
 
-    # Check for task list format
-    task_match = re.match(r'^\[([ xX])\](\s*)(.*)$', remaining_content)
+    # Check for task list format, only content starting with a checkbox can be a task
+    task_match = _TASK_RE.match(remaining_content) if remaining_content[:1] == '[' else None
 
     if task_match:
         status = 'checked' if task_match.group(1).lower() == 'x' else 'unchecked'
@@ -125,97 +133,3 @@ def is_ordered_list_item(stripped_line: str, line: str) -> Tuple[bool, str, str,
         item_indent += len(spaces_after_marker)
 
     return True, content, marker, None, item_indent, marker_indent
-
-'''
-
-def is_unordered_list_item(stripped_line: str, line: str) -> Tuple[bool, str, int, int]:
-    """Check if line is an unordered list item and return value, indent and marker_indent."""
-    markers = {'-', '*', '+'}
-
-    # Get the initial indent before the marker
-    marker_indent = len(line) - len(line.lstrip())
-    non_stripped_line = line.lstrip()  # Line with only leading spaces removed
-
-    # Check if remaining line starts with a marker
-    if not any(non_stripped_line.startswith(m) for m in markers):
-        return False, '', 0, 0
-
-    marker = non_stripped_line[0]
-
-    # Must have at least one space after marker
-    if len(non_stripped_line) < 2 or non_stripped_line[1] != ' ':
-        return False, '', 0, 0
-
-    # Get the content after marker and space
-    content = non_stripped_line[2:].lstrip()  # Remove leading spaces after marker
-
-    # Check if it's not a separator
-    if all(c == marker or c.isspace() for c in content):
-        marker_count = sum(1 for c in content if c == marker)
-        if marker_count >= 2:
-            return False, '', 0, 0
-
-    # Calculate spaces after marker before content
-    spaces_after_marker = len(non_stripped_line[2:]) - len(content)
-    item_indent = marker_indent + 1 + spaces_after_marker + 1  # marker_indent + marker + spaces_after_marker
-
-    return True, content, item_indent, marker_indent
-
-def is_ordered_list_item(stripped_line: str, line: str) -> Tuple[bool, str, str, int, int]:
-    """Check if line is an ordered list item and return value, marker, indent and marker_indent."""
-    # Get the initial indent before the marker
-    marker_indent = len(line) - len(line.lstrip())
-    non_stripped_line = line.lstrip()  # Line with only leading spaces removed
-
-    match = re.match(r'^(\d{1,9}[).])\s+(.+)$', non_stripped_line)
-    if not match:
-        return False, '', '', 0, 0
-
-    marker = match.group(1)
-    value = match.group(2)
-
-    # Calculate spaces between marker and content
-    spaces_after_marker = len(non_stripped_line[len(marker):]) - len(non_stripped_line[len(marker):].lstrip())
-    item_indent = marker_indent + len(marker) + spaces_after_marker #+ 1
-
-    return True, value, marker, item_indent, marker_indent
-
-# TODO: This should be a check in ordered or unordered list
-# Why? Because an ordered and unordered list can be a task list
-# Task lists are either ordered or unordered lists
-def is_task_list(stripped_line: str, line: str) -> Tuple[bool, str, str, int, int]:
-    """
-    Check if a line is a task list item.
-
-    Args:
-        stripped_line (str): Line with whitespace stripped
-        line (str): Original line
-
-    Returns:
-        Tuple[bool, str, str, int, int]:
-            - is_task_list: Whether line is a valid task list item
-            - content: Content after checkbox
-            - status: 'checked' or 'unchecked'
-            - item_indent: Indentation of content
-            - marker_indent: Indentation before marker
-    """
-    marker_indent = len(line) - len(line.lstrip())
-    non_stripped_line = line.lstrip()
-
-    if not non_stripped_line.startswith('- '):
-        return False, '', '', 0, 0
-
-    checkbox_pattern = r'^\- \[([ xX])\]\s*(.*)$'
-    match = re.match(checkbox_pattern, non_stripped_line)
-
-    if not match:
-        return False, '', '', 0, 0
-
-    status = 'checked' if match.group(1).lower() == 'x' else 'unchecked'
-    content = match.group(2)
-
-    spaces_after_marker = len(non_stripped_line[4:]) - len(content) if content else 1
-    item_indent = marker_indent + 4 + spaces_after_marker
-
-    return True, content, status, item_indent, marker_indent
-'''
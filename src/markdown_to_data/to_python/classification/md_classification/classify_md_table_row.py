@@ -1,4 +1,10 @@
 from typing import Dict, Any, Tuple, List
+from functools import lru_cache
+
+@lru_cache(maxsize=256)
+def _cell_keys(cell_type: str, count: int) -> Tuple[str, ...]:
+    """Get the keys (`td_1`, ...) of `count` cells, cached as an immutable tuple per cell type and count."""
+    return tuple(f'{cell_type}_{i}' for i in range(1, count + 1))
 
 def convert_cell_value(value: str) -> Any:
     """Convert cell value to appropriate type."""
@@ -6,7 +12,10 @@ def convert_cell_value(value: str) -> Any:
     if not value:
         return None
 
-    # Try numeric conversion
+    # Try numeric conversion, only values starting like a number can be one
+    first_char = value[0]
+    if not first_char.isdigit() and first_char not in '+-.':
+        return value
     try:
         if '.' in value:
             return float(value)
@@ -27,6 +36,14 @@ def is_separator_row(line: str) -> bool:
     if '-' not in cleaned:
         return False
 
+    # Cheap checks on the whole line first: content rows fail on their first cell character,
+    # lines of only hyphens, spaces and pipes are separators
+    first_char = cleaned[0]
+    if first_char != '-' and not first_char.isspace():
+        return False
+    if not cleaned.strip('- |'):
+        return True
+
     # Split into cells and check each cell
     cells = [cell.strip() for cell in cleaned.split('|')]
     for cell in cells:
@@ -72,15 +89,13 @@ def is_table_row(line: str, is_header: bool = False) -> Tuple[bool, Dict[str, An
         return False, {}
 
     # Create row dictionary
-    row_dict = {'tr': {}, 'indent': indent}
-    cell_type = 'th' if is_header else 'td'
+    cell_keys = _cell_keys('th' if is_header else 'td', len(cells))
 
     # Handle single cell (merged columns)
     #if len(cells) == 1:
         #row_dict['tr'][cell_type] = convert_cell_value(cells[0])
         #else:
     # Multiple cells
-    for i, cell in enumerate(cells):
-        row_dict['tr'][f'{cell_type}_{i+1}'] = convert_cell_value(cell)
+    row_dict: Dict[str, Any] = {'tr': dict(zip(cell_keys, map(convert_cell_value, cells))), 'indent': indent}
 
     return True, row_dict
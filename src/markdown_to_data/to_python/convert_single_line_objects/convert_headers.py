@@ -39,16 +39,27 @@ Output:
 """
 from typing import List, Dict, Any
 
-def _is_header(item: Dict[str, Any]) -> bool:
-    """Check if an item is a header."""
-    return any(f'h{i}' in item for i in range(1, 7))
+# Interned header keys by level, instead of formatting them for every item
+_HEADER_KEYS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
 
 def _get_header_level(item: Dict[str, Any]) -> int:
-    """Get the level of the header (1-6)."""
-    for i in range(1, 7):
-        if f'h{i}' in item:
-            return i
-    return 0  # Should never happen if _is_header was called first
+    """Get the level of the header (1-6), 0 if the item is no header."""
+    for level, key in enumerate(_HEADER_KEYS, 1):
+        if key in item:
+            return level
+    return 0
+
+def convert_header(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a single header item (h1-h6) into a header object, returning other items unchanged."""
+    level = _get_header_level(item)
+    if not level:
+        return item
+    return {
+        'header': {
+            'level': level,
+            'content': item[_HEADER_KEYS[level - 1]]
+        }
+    }
 
 def convert_headers(classified_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
@@ -63,19 +74,4 @@ def convert_headers(classified_list: List[Dict[str, Any]]) -> List[Dict[str, Any
         List containing converted header objects and all other markdown elements
         in their original order
     """
-    result = []
-
-    for item in classified_list:
-        if _is_header(item):
-            level = _get_header_level(item)
-            content = item[f'h{level}']
-            result.append({
-                'header': {
-                    'level': level,
-                    'content': content
-                }
-            })
-        else:
-            result.append(item)
-
-    return result
+    return [convert_header(item) for item in classified_list]
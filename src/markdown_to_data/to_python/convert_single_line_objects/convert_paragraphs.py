@@ -4,6 +4,14 @@ def _is_paragraph(item: Dict[str, Any]) -> bool:
     """Check if an item is a paragraph."""
     return 'p' in item
 
+def convert_paragraph(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a single paragraph item (p) into a paragraph object, returning other items unchanged."""
+    if _is_paragraph(item):
+        return {
+            'paragraph': item['p']
+        }
+    return item
+
 def convert_paragraphs(classified_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Process classified markdown items, converting paragraphs (p)
@@ -16,16 +24,4 @@ def convert_paragraphs(classified_list: List[Dict[str, Any]]) -> List[Dict[str,
         List containing converted paragraph objects and all other markdown elements
         in their original order
     """
-    result = []
-
-    for item in classified_list:
-        if _is_paragraph(item):
-            # Convert hr to separator
-            result.append({
-                'paragraph': item['p']
-            })
-        else:
-            # Keep non-paragraph items as they are
-            result.append(item)
-
-    return result
+    return [convert_paragraph(item) for item in classified_list]
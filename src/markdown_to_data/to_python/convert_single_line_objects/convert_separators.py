@@ -35,6 +35,14 @@ def _is_separator(item: Dict[str, Any]) -> bool:
     """Check if an item is a separator."""
     return 'hr' in item
 
+def convert_separator(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a single horizontal rule item (hr) into a separator object, returning other items unchanged."""
+    if _is_separator(item):
+        return {
+            'separator': item['hr']
+        }
+    return item
+
 def convert_separators(classified_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Process classified markdown items, converting horizontal rule markers (hr)
@@ -47,16 +55,4 @@ def convert_separators(classified_list: List[Dict[str, Any]]) -> List[Dict[str,
         List containing converted separator objects and all other markdown elements
         in their original order
     """
-    result = []
-
-    for item in classified_list:
-        if _is_separator(item):
-            # Convert hr to separator
-            result.append({
-                'separator': item['hr']
-            })
-        else:
-            # Keep non-separator items as they are
-            result.append(item)
-
-    return result
+    return [convert_separator(item) for item in classified_list]
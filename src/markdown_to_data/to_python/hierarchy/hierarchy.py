@@ -41,7 +41,8 @@ def build_hierarchy_for_dict(merged_elements: List[Dict[str, Any]]) -> Dict[str,
     result: Dict[str, Any] = {}
     current_level = result
     level_stack = [result]
-    key_counts = defaultdict(int)
+    # Number of elements per key under the current heading, numbering them without searching for free keys
+    key_counts: Dict[str, int] = defaultdict(int)
 
     for item in merged_elements:
         if 'metadata' in item:
@@ -53,24 +54,16 @@ def build_hierarchy_for_dict(merged_elements: List[Dict[str, Any]]) -> Dict[str,
             while len(level_stack) > heading_level:
                 level_stack.pop()
 
-            if len(level_stack) < heading_level:
-                new_level = {}
-                level_stack[-1][heading_text] = new_level
-                level_stack.append(new_level)
-            else:
-                level_stack[-1][heading_text] = {}
-                level_stack.append(level_stack[-1][heading_text])
+            new_level: Dict[str, Any] = {}
+            level_stack[-1][heading_text] = new_level
+            level_stack.append(new_level)
 
             current_level = level_stack[-1]
             key_counts.clear()  # Reset key counts for each new heading level
         else:
             for key, value in item.items():
-                key_counts[key] += 1
-                if key_counts[key] > 1:
-                    new_key = f"{key}_{key_counts[key]}"
-                else:
-                    new_key = f"{key}_1"
-                    #new_key = key
-                current_level[new_key] = value
+                count = key_counts[key] + 1
+                key_counts[key] = count
+                current_level[f"{key}_{count}"] = value
 
     return result
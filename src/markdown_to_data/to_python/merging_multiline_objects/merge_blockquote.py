@@ -84,11 +84,20 @@ def _get_blockquote_content(item: Dict[str, Any]) -> str:
     return item['blockquote']
 
 def _build_nested_blockquote(items: List[Dict[str, Any]], start_idx: int, base_level: int) -> Tuple[List[Dict[str, Any]], int]:
-    """Build a nested blockquote structure starting from given index."""
-    result = []
+    """
+    Build a nested blockquote structure starting from given index.
+
+    The nesting is tracked with an explicit stack instead of recursion, kept as two parallel lists of
+    levels and the item lists collecting them, so no frame object is allocated per nesting level:
+    a deeper item opens a frame collecting into the previous item's items, a shallower one closes frames.
+    """
+    result: List[Dict[str, Any]] = []
+    stack_levels = [base_level]
+    stack_items = [result]
     i = start_idx
+    length = len(items)
 
-    while i < len(items):
+    while i < length:
         current_item = items[i]
 
         if not _is_blockquote(current_item) or current_item['level'] < base_level:
@@ -96,26 +105,24 @@ def _build_nested_blockquote(items: List[Dict[str, Any]], start_idx: int, base_l
 
         current_level = current_item['level']
 
+        # Close the frames of deeper levels, the base frame is never closed
+        while current_level < stack_levels[-1]:
+            stack_levels.pop()
+            stack_items.pop()
+
+        level_items = stack_items[-1]
+        if current_level > stack_levels[-1]:
+            # This is a nested item, add to previous item's items
+            level_items = level_items[-1]['items']
+            stack_levels.append(current_level)
+            stack_items.append(level_items)
+
         # Create new blockquote item
-        new_item = {
+        level_items.append({
             'content': _get_blockquote_content(current_item),
             'items': []
-        }
-
-        # Handle nesting
-        if current_level > base_level:
-            # This is a nested item, add to previous item's items
-            if not result:
-                # Should never happen with valid input
-                raise ValueError("Invalid blockquote structure")
-
-            nested_items, new_i = _build_nested_blockquote(items, i, current_level)
-            result[-1]['items'].extend(nested_items)
-            i = new_i
-        else:
-            # This is an item at the current level
-            result.append(new_item)
-            i += 1
+        })
+        i += 1
 
     return result, i
 
@@ -131,26 +138,27 @@ def merge_blockquotes(classified_md: List[Dict[str, Any]]) -> List[Dict[str, Any
         List containing merged blockquote objects and all other markdown elements
         in their original order
     """
-    result = []
-    i = 0
-
-    while i < len(classified_md):
-        current_item = classified_md[i]
-
-        if _is_blockquote(current_item):
-            # Start of a blockquote segment
-            base_level = current_item['level']
-            blockquote_items, new_i = _build_nested_blockquote(classified_md, i, base_level)
-
-            # Add merged blockquote structure
-            result.append({
-                'blockquote': blockquote_items
-            })
-
-            i = new_i
-        else:
-            # Add non-blockquote items directly
-            result.append(current_item)
-            i += 1
+    result: List[Dict[str, Any]] = []
+    # End of the elements already added, the elements between blockquotes are added as one slice
+    copied = 0
+
+    for i in [i for i, item in enumerate(classified_md) if 'blockquote' in item]:
+        # Skip blockquote lines merged into the previous blockquote
+        if i < copied:
+            continue
+
+        # Add non-blockquote items directly
+        result.extend(classified_md[copied:i])
+
+        # Start of a blockquote segment
+        base_level = classified_md[i]['level']
+        blockquote_items, copied = _build_nested_blockquote(classified_md, i, base_level)
+
+        # Add merged blockquote structure
+        result.append({
+            'blockquote': blockquote_items
+        })
+
+    result.extend(classified_md[copied:])
 
     return result
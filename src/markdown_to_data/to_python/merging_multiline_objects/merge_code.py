@@ -1,12 +1,13 @@
 from typing import List, Text, Any, Dict
-import re
+import sys
 
-def _extract_md_code(markdown_snippet: str) -> Dict[str, Any]:
+_LANGUAGE_CHARS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+-'
+
+def _extract_md_code_from_lines(lines: List[str]) -> Dict[str, Any]:
     '''
-    Extracts a markdown code block out of the given markdown text snippet.
-    The first appearing markdown code block is extracted while others are ignored.
+    Extracts the first markdown code block out of the given lines.
+    Scanning stops at the closing fence of the first code block.
     '''
-    lines = markdown_snippet.splitlines()
     in_code_block = False
     code_block_lines = []
     potential_language = None
@@ -41,8 +42,9 @@ def _extract_md_code(markdown_snippet: str) -> Dict[str, Any]:
             content = ''
 
         # Validate language identifier
-        if potential_language and re.match(r'^[a-zA-Z0-9+-]+$', potential_language):
-            language = potential_language.lower()
+        if potential_language and not potential_language.strip(_LANGUAGE_CHARS):
+            # Interned, as the few languages in use recur across code blocks and documents
+            language = sys.intern(potential_language.lower())
         else:
             language = None
             if potential_language:
@@ -74,7 +76,7 @@ def merge_code_blocks(classified_list: List[Dict[str, Text | Any]]) -> List[Dict
                     # End of code block
                     temp_code_block.append(item['code'])
                     #result.append({'code': '\n'.join(temp_code_block)})
-                    result.append({'code': _extract_md_code(markdown_snippet='\n'.join(temp_code_block))})
+                    result.append({'code': _extract_md_code_from_lines(temp_code_block)})
                     temp_code_block.clear()
                     in_code_block = False
                 else:
@@ -94,7 +96,7 @@ def merge_code_blocks(classified_list: List[Dict[str, Text | Any]]) -> List[Dict
     if in_code_block:
         temp_code_block.append(start_delimiter)
         #result.append({'code': '\n'.join(temp_code_block)})
-        result.append({'code': _extract_md_code(markdown_snippet='\n'.join(temp_code_block))})
+        result.append({'code': _extract_md_code_from_lines(temp_code_block)})
 
 
     return result
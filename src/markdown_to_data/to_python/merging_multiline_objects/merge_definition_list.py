@@ -36,10 +36,6 @@ output:
 
 from typing import List, Dict, Any
 
-def _is_definition_term(item: Dict[str, Any]) -> bool:
-    """Check if the item is a definition term."""
-    return 'dt' in item
-
 def _is_definition_description(item: Dict[str, Any]) -> bool:
     """Check if the item is a definition description."""
     return 'dd' in item
@@ -56,37 +52,37 @@ def merge_definition_lists(classified_md: List[Dict[str, Any]]) -> List[Dict[str
         List containing merged definition list objects and all other markdown elements
         in their original order
     """
-    result = []
-    i = 0
+    result: List[Dict[str, Any]] = []
+    length = len(classified_md)
+    # End of the elements already added, the elements between definition lists are added as one slice
+    copied = 0
 
-    while i < len(classified_md):
-        current_item = classified_md[i]
+    # If we find a definition term
+    for i in [i for i, item in enumerate(classified_md) if 'dt' in item]:
+        # Add non-definition list items directly to result
+        result.extend(classified_md[copied:i])
 
-        # If we find a definition term
-        if _is_definition_term(current_item):
-            term = current_item['dt']
-            definitions = []
+        term = classified_md[i]['dt']
+        definitions = []
 
-            # Look ahead for definitions
-            j = i + 1
-            while j < len(classified_md) and _is_definition_description(classified_md[j]):
-                definitions.append(classified_md[j]['dd'])
-                j += 1
+        # Look ahead for definitions
+        j = i + 1
+        while j < length and _is_definition_description(classified_md[j]):
+            definitions.append(classified_md[j]['dd'])
+            j += 1
 
-            # Create definition list object
-            def_list = {
-                'def_list': {
-                    'term': term,
-                    'list': definitions
-                }
+        # Create definition list object
+        def_list = {
+            'def_list': {
+                'term': term,
+                'list': definitions
             }
-            result.append(def_list)
+        }
+        result.append(def_list)
+
+        # Move past the processed definitions
+        copied = j
 
-            # Move index past the processed definitions
-            i = j
-        else:
-            # Add non-definition list items directly to result
-            result.append(current_item)
-            i += 1
+    result.extend(classified_md[copied:])
 
     return result
@@ -26,43 +26,54 @@ def _create_list_item(item: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 def _build_nested_list(items: List[Dict[str, Any]], start_idx: int, base_indent: int) -> Tuple[List[Dict[str, Any]], int]:
-    """Build a nested list structure starting from given index."""
-    result = []
+    """
+    Build a nested list structure starting from given index.
+
+    The nesting is tracked with an explicit stack of the indents and the item lists collecting them,
+    as in the blockquote merging: an item followed by a deeper one opens a frame collecting into its items,
+    an item indented less than the current frame closes frames.
+    """
+    result: List[Dict[str, Any]] = []
+    stack_indents = [base_indent]
+    stack_items = [result]
     i = start_idx
+    length = len(items)
 
-    while i < len(items):
+    while i < length:
         current_item = items[i]
         current_indent = current_item['marker_indent']
 
-        # If we're back to a lower indent level, exit this nesting level
-        if current_indent < base_indent:
+        # If we're back to a lower indent level, exit the nesting levels above it
+        while current_indent < stack_indents[-1] and len(stack_indents) > 1:
+            stack_indents.pop()
+            stack_items.pop()
+        if current_indent < stack_indents[-1]:
             break
 
         # Create new item
         new_item = _create_list_item(current_item)
+        stack_items[-1].append(new_item)
 
         # Look ahead for nested items
-        if i + 1 < len(items):
+        if i + 1 < length:
             next_indent = items[i + 1].get('marker_indent', 0)
             if next_indent > current_indent:
-                nested_items, new_i = _build_nested_list(items, i + 1, next_indent)
-                new_item['items'] = nested_items
-                i = new_i - 1
+                stack_indents.append(next_indent)
+                stack_items.append(new_item['items'])
 
-        result.append(new_item)
         i += 1
 
     return result, i
 
-def _identify_list_segments(classified_md: List[Dict[str, Any]]) -> List[Tuple[List[Dict[str, Any]], str]]:
+def _identify_list_segments(classified_md: List[Dict[str, Any]]) -> List[Tuple[List[Dict[str, Any]], str | None]]:
     """
     Identify continuous list segments.
 
     Returns:
         List of tuples: (list_items, list_type)
     """
-    segments = []
-    current_segment = []
+    segments: List[Tuple[List[Dict[str, Any]], str | None]] = []
+    current_segment: List[Dict[str, Any]] = []
     current_type = None
     i = 0
 
@@ -113,7 +124,7 @@ def merge_lists(classified_md: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         List containing merged list objects and all other markdown elements in their original order
     """
     result = []
-    current_segment = []
+    current_segment: List[Dict[str, Any]] = []
     current_type = None
 
     for item in classified_md:
@@ -1,5 +1,9 @@
 from typing import List, Dict, Any, Tuple
-import re
+from functools import lru_cache
+
+# Scalars resolved by lookup on the lowercased value
+_SCALARS: Dict[str, Any] = {'true': True, 'false': False, '': None}
+_NUMBER_START = '+-.'
 
 def _is_separator(item: Dict[str, Any]) -> bool:
     """Check if an item is a separator."""
@@ -22,10 +26,10 @@ def _is_valid_key_value_pair(text: str) -> Tuple[bool, Tuple[str, str] | None]:
     Check if a string is a valid key-value pair and return the parsed parts.
     Returns (is_valid, (key, value)) or (is_valid, None)
     """
-    if ':' not in text:
+    key, separator, value = text.partition(':')
+    if not separator:
         return False, None
 
-    key, value = text.split(':', 1)
     key = key.strip()
 
     if not key:  # Empty key is invalid
@@ -34,67 +38,86 @@ def _is_valid_key_value_pair(text: str) -> Tuple[bool, Tuple[str, str] | None]:
     return True, (key, value.strip())
 
 def _normalize_key(key: str) -> str:
-    """Normalize metadata key by converting spaces to underscores."""
-    return re.sub(r'\s+', '_', key.strip())
+    """Normalize metadata key by converting runs of whitespace to single underscores."""
+    return '_'.join(key.split())
+
+def _split_quoted_list_value(value: str) -> List[str]:
+    """
+    Split a list value by commas in a single left-to-right scan, preserving commas in quotes.
+    Quoted parts lose their quotes, an unclosed quote swallows the rest of the value, which drops the last item.
+    """
+    items: List[str] = []
+    current_item: List[str] = []
+    pos = 0
+    length = len(value)
+
+    while pos < length:
+        char = value[pos]
+        if char == ',':
+            items.append(''.join(current_item).strip())
+            current_item = []
+            pos += 1
+        elif char == '"' or char == "'":
+            end = value.find(char, pos + 1)
+            if end < 0:
+                return items
+            current_item.append(value[pos + 1:end])
+            pos = end + 1
+        else:
+            # Plain text runs up to the next comma or quote
+            end = length
+            for delimiter in ',"\'':
+                found = value.find(delimiter, pos, end)
+                if found >= 0:
+                    end = found
+            current_item.append(value[pos:end])
+            pos = end
+
+    # Flush the last item
+    items.append(''.join(current_item).strip())
+    return items
 
 def _parse_list_value(value: str) -> List[Any]:
     """Parse a string value into a list, handling various formats."""
     # Remove brackets or parentheses if present
     value = value.strip()
-    if value.startswith(('[', '(')) and value.endswith((']', ')')):
+    if value and value[0] in '[(' and value[-1] in '])':
         value = value[1:-1]
 
-    # Split by commas, but preserve commas in quotes
-    items = []
-    current_item = []
-    in_quotes = False
-    quote_char = None
-
-    for char in value + ',':  # Add comma to handle last item
-        if char in '"\'':
-            if not in_quotes:
-                in_quotes = True
-                quote_char = char
-            elif char == quote_char:
-                in_quotes = False
-                quote_char = None
-            else:
-                current_item.append(char)
-        elif char == ',' and not in_quotes:
-            items.append(''.join(current_item).strip())
-            current_item = []
-        else:
-            current_item.append(char)
+    # Without quotes every comma separates items
+    if '"' not in value and "'" not in value:
+        items = value.split(',')
+    else:
+        items = _split_quoted_list_value(value)
 
     # Filter out empty items and process each item
     return [_parse_single_value(item.strip()) for item in items if item.strip()]
 
+@lru_cache(maxsize=2048)
 def _parse_single_value(value: str) -> Any:
-    """Parse a single value into its appropriate type."""
+    """
+    Parse a single value into its appropriate type.
+    Cached, since the same values recur across documents and the results are immutable scalars.
+    """
     value = value.strip()
 
     # Remove quotes if present
-    if (value.startswith('"') and value.endswith('"')) or \
-       (value.startswith("'") and value.endswith("'")):
+    if value and value[0] in '"\'' and value[-1] == value[0]:
         return value[1:-1]
 
-    # Check for boolean
-    if value.lower() == 'true':
-        return True
-    if value.lower() == 'false':
-        return False
-
-    # Check for None
-    if not value:
-        return None
+    # Check for boolean or None
+    scalar = _SCALARS.get(value.lower(), value)
+    if scalar is not value:
+        return scalar
 
-    # Check for number
-    try:
-        if '.' in value:
-            return float(value)
-        return int(value)
-    except ValueError:
-        pass
+    # Check for number, only values starting like a number can be one
+    if value[0].isdigit() or value[0] in _NUMBER_START:
+        try:
+            if '.' in value:
+                return float(value)
+            return int(value)
+        except ValueError:
+            pass
 
     return value
 
@@ -102,88 +125,66 @@ def _parse_metadata_value(value: str) -> Any:
     """Parse metadata value into appropriate type."""
     value = value.strip()
 
-    # Check if it's a list format
-    if value.startswith(('[', '(')) and value.endswith((']', ')')):
-        return _parse_list_value(value)
+    if not value:
+        return _parse_single_value(value)
 
-    # Check if it's a comma-separated list
-    if ',' in value and not (value.startswith('"') or value.startswith("'")):
+    # Check if it's a list format or a comma-separated list (only scanned for commas if not quoted)
+    first = value[0]
+    if (first in '[(' and value[-1] in '])') or (first not in '"\'' and ',' in value):
         return _parse_list_value(value)
 
     return _parse_single_value(value)
 
-def _validate_metadata_block(items: List[Dict[str, Any]]) -> bool:
-    """Validate that the metadata block is properly formed."""
-    if not items:
-        return False
+def merge_metadata(classified_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Process and merge metadata blocks in markdown content.
+    Returns the original list if metadata is malformed.
+    Keeps all content after the metadata block.
 
-    # Find first non-empty paragraph
+    The block is validated in a single pass collecting the key-value pairs,
+    which are only parsed once the block turned out to be well-formed.
+    """
+    # Short-circuit documents without front matter: the first item which is not an
+    # empty paragraph has to be the opening separator
+    length = len(classified_list)
     start_idx = 0
-    while start_idx < len(items) and _is_empty_paragraph(items[start_idx]):
+    while start_idx < length and _is_empty_paragraph(classified_list[start_idx]):
         start_idx += 1
 
-    if start_idx >= len(items) or not _is_separator(items[start_idx]):
-        return False
+    if start_idx >= length or not _is_separator(classified_list[start_idx]):
+        return classified_list
 
-    # Get separator type
-    separator_type = _get_separator_type(items[start_idx])
+    separator_type = _get_separator_type(classified_list[start_idx])
 
-    # Find matching end separator
+    # Collect metadata content until the matching end separator. The scan stops at the
+    # first element that can't be part of the block, so it never walks the whole document.
+    kv_pairs = []
     end_idx = start_idx + 1
-    while end_idx < len(items):
-        if _is_separator(items[end_idx]):
-            if _get_separator_type(items[end_idx]) != separator_type:
-                return False
+    while end_idx < length:
+        # A single lookup per element kind instead of membership test plus access
+        item = classified_list[end_idx]
+        item_separator = item.get('separator')
+        if item_separator is not None:
+            if item_separator != separator_type:
+                return classified_list
             break
+        paragraph = item.get('paragraph')
+        if paragraph is None:
+            return classified_list
+        if paragraph.strip():
+            is_valid, kv_pair = _is_valid_key_value_pair(paragraph)
+            if not is_valid or kv_pair is None:
+                return classified_list
+            kv_pairs.append(kv_pair)
         end_idx += 1
     else:
-        return False
-
-    # Validate content between separators
-    for item in items[start_idx + 1:end_idx]:
-        if not _is_paragraph(item):
-            return False
-        if not _is_empty_paragraph(item):
-            is_valid, _ = _is_valid_key_value_pair(item['paragraph'])
-            if not is_valid:
-                return False
-
-    return True
-
-def merge_metadata(classified_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Process and merge metadata blocks in markdown content.
-    Returns the original list if metadata is malformed.
-    Keeps all content after the metadata block.
-    """
-    if not _validate_metadata_block(classified_list):
         return classified_list
 
-    # Find metadata block boundaries
-    start_idx = 0
-    while start_idx < len(classified_list) and _is_empty_paragraph(classified_list[start_idx]):
-        start_idx += 1
-
-    end_idx = start_idx + 1
-    while end_idx < len(classified_list) and not _is_separator(classified_list[end_idx]):
-        end_idx += 1
+    metadata = {_normalize_key(key): _parse_metadata_value(value) for key, value in kv_pairs}
 
-    # Process metadata content
-    metadata = {}
-    for item in classified_list[start_idx + 1:end_idx]:
-        if not _is_empty_paragraph(item):
-            is_valid, kv_pair = _is_valid_key_value_pair(item['paragraph'])
-            if is_valid and kv_pair is not None:
-                key, value = kv_pair
-                normalized_key = _normalize_key(key)
-                parsed_value = _parse_metadata_value(value)
-                metadata[normalized_key] = parsed_value
-
-    # Combine metadata with remaining content
-    result = [{'metadata': metadata}]
-
-    # Add all content after the metadata block
-    if end_idx + 1 < len(classified_list):
-        result.extend(classified_list[end_idx + 1:])
+    # Combine metadata with all content after the metadata block by copying the
+    # tail once and replacing the closing separator with the metadata element
+    result = classified_list[end_idx:]
+    result[0] = {'metadata': metadata}
 
     return result
@@ -3,15 +3,20 @@ This module handles the merging of classified markdown table rows into structure
 It supports tables with and without headers, handling inconsistent columns and missing values.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from functools import lru_cache
+import sys
 
-def _is_table_row(item: Dict[str, Any]) -> bool:
-    """Check if an item is a table row."""
-    return 'tr' in item
-
-def _is_separator(item: Dict[str, Any]) -> bool:
-    """Check if an item is a table separator."""
-    return _is_table_row(item) and item['tr'] == 'table_separator'
+@lru_cache(maxsize=256)
+def _column_keys(count: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Get the cell keys (`td_1`, ...) and generated column names (`col_1`, ...) of `count` columns.
+    Cached as immutable tuples per column count, so tables of the same width share them.
+    """
+    return (
+        tuple(f'td_{i}' for i in range(1, count + 1)),
+        tuple(f'col_{i}' for i in range(1, count + 1))
+    )
 
 def _normalize_value(value: Any) -> Any:
     """Normalize cell values, converting empty strings to None."""
@@ -19,64 +24,73 @@ def _normalize_value(value: Any) -> Any:
         return None
     return value
 
-def _extract_headers(segment: List[Dict[str, Any]]) -> List[str]:
-    """Extract headers from table segment or generate column numbers."""
-    max_cols = max(
-        len(row['tr']) for row in segment
-        if _is_table_row(row) and isinstance(row['tr'], dict)
-    )
-
-    # Find first row (header candidates)
-    header_row = next(
-        (row for row in segment if _is_table_row(row) and isinstance(row['tr'], dict)),
-        None
-    )
+def _extract_headers(rows: List[Dict[str, Any]], max_cols: int, has_separator: bool) -> List[str]:
+    """Extract headers from the table rows or generate column numbers."""
+    cell_keys, column_names = _column_keys(max_cols)
 
     # If there's a separator, use first row as headers
-    has_separator = any(_is_separator(row) for row in segment)
-    if has_separator and header_row:
-        headers = []
-        for i in range(1, max_cols + 1):
-            key = f'td_{i}'
-            header_value = header_row['tr'].get(key)
-            headers.append(header_value if header_value else f'col_{i}')
-        return headers
+    if has_separator and rows:
+        header_row = rows[0]
+        headers = [
+            header_row.get(key) or column_name
+            for key, column_name in zip(cell_keys, column_names)
+        ]
+        # Interned, as header names recur across tables and documents and become the column keys
+        return [sys.intern(header) if type(header) is str else header for header in headers]
 
     # Generate numbered columns
-    return [f'col_{i}' for i in range(1, max_cols + 1)]
-
-def _build_column_structure(segment: List[Dict[str, Any]], headers: List[str]) -> Dict[str, List[Any]]:
-    """Build column-based structure from table data."""
-    # Initialize columns
-    columns = {header: [] for header in headers}
-
-    # Find start of data rows
-    start_idx = 0
-    has_separator = any(_is_separator(row) for row in segment)
-    if has_separator:
-        start_idx = 1
-        for i, row in enumerate(segment):
-            if _is_separator(row):
-                start_idx = i + 1
-                break
-
-    # Process data rows
-    for row in segment[start_idx:]:
-        if not _is_table_row(row) or not isinstance(row['tr'], dict):
-            continue
-
+    return list(column_names)
+
+def _build_column_structure(rows: List[Dict[str, Any]], headers: List[str], start_idx: int) -> Dict[str, List[Any]]:
+    """Build column-based structure from the table rows, starting at the first data row."""
+    cell_keys = _column_keys(len(headers))[0]
+    data_rows = rows[start_idx:]
+
+    # Header-only tables have empty columns, nothing to collect
+    if not data_rows:
+        return {header: [] for header in headers}
+
+    # Duplicate headers share one column, which collects their values row by row
+    if len(set(headers)) < len(headers):
+        columns: Dict[str, List[Any]] = {header: [] for header in headers}
+        column_keys = [(columns[header], key) for header, key in zip(headers, cell_keys)]
+        for row in data_rows:
+            for column, key in column_keys:
+                column.append(_normalize_value(row.get(key)))
+        return columns
+
+    # Preallocate the columns, as the number of data rows is known
+    row_count = len(data_rows)
+    columns = {header: [None] * row_count for header in headers}
+    column_keys = [(columns[header], key) for header, key in zip(headers, cell_keys)]
+
+    # Process data rows, with `_normalize_value` inlined as it runs once per cell
+    for row_idx, row in enumerate(data_rows):
         # Add values to each column
-        for i, header in enumerate(headers):
-            key = f'td_{i+1}'
-            value = _normalize_value(row['tr'].get(key))
-            columns[header].append(value)
+        for column, key in column_keys:
+            value = row.get(key)
+            column[row_idx] = None if value == '' else value
 
     return columns
 
-def _process_table_segment(segment: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Process a continuous segment of table rows into a structured table."""
-    headers = _extract_headers(segment)
-    columns = _build_column_structure(segment, headers)
+def _process_table_segment(segment_rows: List[Any]) -> Dict[str, Any]:
+    """Process the row values (`'tr'`) of a continuous segment of table rows into a structured table."""
+    # Collect the row cells, the column count and the first data row in a single pass
+    rows = []
+    max_cols = 0
+    start_idx = 0
+    has_separator = False
+    for row in segment_rows:
+        if isinstance(row, dict):
+            rows.append(row)
+            if len(row) > max_cols:
+                max_cols = len(row)
+        elif not has_separator and row == 'table_separator':
+            has_separator = True
+            start_idx = len(rows)
+
+    headers = _extract_headers(rows, max_cols, has_separator)
+    columns = _build_column_structure(rows, headers, start_idx)
 
     return {
         'table': columns
@@ -94,21 +108,21 @@ def merge_tables(classified_md: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         List containing merged table objects and all other markdown elements in their original order
     """
     result = []
-    current_segment = []
+    segment_rows: List[Any] = []
 
+    # Single walk: table rows are collected until the first element after them ends the segment
     for item in classified_md:
-        if _is_table_row(item):
-            current_segment.append(item)
-        else:
-            # Process any existing segment
-            if current_segment:
-                result.append(_process_table_segment(current_segment))
-                current_segment = []
-            # Add non-table item to result
-            result.append(item)
-
-    # Handle last segment if exists
-    if current_segment:
-        result.append(_process_table_segment(current_segment))
+        row = item.get('tr')
+        if row is not None:
+            segment_rows.append(row)
+            continue
+        if segment_rows:
+            result.append(_process_table_segment(segment_rows))
+            segment_rows = []
+        # Add non-table item to result
+        result.append(item)
+
+    if segment_rows:
+        result.append(_process_table_segment(segment_rows))
 
     return result
@@ -8,9 +8,9 @@ from .merging_multiline_objects.merge_metadata import merge_metadata
 from .merging_multiline_objects.merge_table import merge_tables
 from .merging_multiline_objects.merge_code import merge_code_blocks
 # CONVERSION
-from .convert_single_line_objects.convert_headers import convert_headers
-from .convert_single_line_objects.convert_separators import convert_separators
-from .convert_single_line_objects.convert_paragraphs import convert_paragraphs
+from .convert_single_line_objects.convert_headers import convert_header
+from .convert_single_line_objects.convert_separators import convert_separator
+from .convert_single_line_objects.convert_paragraphs import convert_paragraph
 # HIERARCHY
 from .hierarchy.hierarchy import build_hierarchy_for_dict
 
@@ -38,41 +38,46 @@ def merge_classified_markdown_lines(classified_list: List[Dict[str, Any]]) -> Li
         - Paragraphs
         - Separators
     """
-    merged_elements = []
+    merged_elements = classified_list
+
+    # Keys of the classified lines, so the merging of element types missing in the document is skipped
+    line_keys = {key for item in classified_list for key in item}
 
     # MERGING MULTLINE ELEMENTS TOGETHER
     # Merge lists
-    merged_elements = merge_lists(classified_md=classified_list)
+    if 'ul' in line_keys or 'ol' in line_keys:
+        merged_elements = merge_lists(classified_md=merged_elements)
     # Merge definition lists
-    merged_elements = merge_definition_lists(classified_md=merged_elements)
+    if 'dt' in line_keys:
+        merged_elements = merge_definition_lists(classified_md=merged_elements)
     # Merge definition lists
-    merged_elements = merge_blockquotes(classified_md=merged_elements)
+    if 'blockquote' in line_keys:
+        merged_elements = merge_blockquotes(classified_md=merged_elements)
     # Merge tables
-    merged_elements = merge_tables(classified_md=merged_elements)
+    if 'tr' in line_keys:
+        merged_elements = merge_tables(classified_md=merged_elements)
     # Merge code blocks
-    merged_elements = merge_code_blocks(classified_list=merged_elements)
+    if 'code' in line_keys:
+        merged_elements = merge_code_blocks(classified_list=merged_elements)
 
     # CONVERSION TO ALIGN OTHER ELEMENTS TO REQUIRED STRUCTURE
-    # Convert headers
-    merged_elements = convert_headers(classified_list=merged_elements)
-    # Convert paragraphs
-    merged_elements = convert_paragraphs(classified_list=merged_elements)
-    # Convert separators
-    merged_elements = convert_separators(classified_list=merged_elements)
-
-    # METADATA
-    # Merge metadata
-    merged_elements = merge_metadata(classified_list=merged_elements)
-
-    # EMPTY PARAGRAPHS -> REMOVE
+    # Convert headers, paragraphs and separators and remove empty paragraphs in a single walk.
+    # The metadata merging skips empty paragraphs anyway, so they can be removed before it.
     merged_elements = [
-            element for element in merged_elements
+            element for element in (
+                convert_separator(convert_paragraph(convert_header(element)))
+                for element in merged_elements
+            )
             if not (
                 'paragraph' in element and
                 not element['paragraph'].strip()
             )
         ]
 
+    # METADATA
+    # Merge metadata
+    merged_elements = merge_metadata(classified_list=merged_elements)
+
     return merged_elements
 
 def hierarchy_with_merged_markdown_lines(merged_elements: List[Dict[str, Any]]) -> Dict[str, Any]:
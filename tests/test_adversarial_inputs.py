@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip('hypothesis')
+
+from hypothesis import given, settings, strategies as st
+
+from src.markdown_to_data.markdown_to_data import Markdown
+
+# Cell text without pipes, hyphens (separator rows) and line breaks, may be empty or whitespace only
+CELL_TEXT = st.text(alphabet='abcXYZ019 ._', max_size=10)
+
+# Large inputs have to be parsed in linear time, so every example gets the same generous deadline
+LINEAR_TIME = settings(deadline=1000, max_examples=50)
+
+@LINEAR_TIME
+@given(
+    column_count=st.integers(min_value=1, max_value=100),
+    rows=st.lists(st.lists(CELL_TEXT, min_size=1, max_size=100), min_size=1, max_size=100)
+)
+def test_large_tables(column_count, rows):
+    """Test that tables up to 100x100 cells merge into one table with a column per header"""
+    header = '| ' + ' | '.join(f'h{i}' for i in range(column_count)) + ' |'
+    separator = '|' + '---|' * column_count
+    body = ['| ' + ' | '.join(row) + ' |' for row in rows]
+
+    md_list = Markdown('\n'.join([header, separator] + body)).md_list
+
+    assert len(md_list) == 1
+    table = md_list[0]['table']
+    assert len(table) >= column_count
+    assert all(len(column) == len(rows) for column in table.values())
+
+@LINEAR_TIME
+@given(levels=st.lists(st.integers(min_value=1, max_value=60), min_size=1, max_size=200))
+def test_deeply_nested_blockquotes(levels):
+    """Test that blockquotes nested up to 60 levels keep every line"""
+    markdown = '\n'.join('>' * level + f' line {i}' for i, level in enumerate(levels))
+
+    md_list = Markdown(markdown).md_list
+
+    # Quotes shallower than the first line start a new blockquote
+    def count_items(items):
+        return sum(1 + count_items(item['items']) for item in items)
+
+    assert all('blockquote' in element for element in md_list)
+    assert sum(count_items(element['blockquote']) for element in md_list) == len(levels)
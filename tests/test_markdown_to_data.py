@@ -0,0 +1,173 @@
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from src.markdown_to_data import markdown_to_data
+from src.markdown_to_data.markdown_to_data import Markdown
+from src.markdown_to_data.to_md.to_md_parser import to_md_parser
+
+MARKDOWN = '''# Header
+
+- item 1
+- item 2
+
+```python
+print("Hello")
+```
+'''
+
+def test_md_elements():
+    """Test count, positions and variants of md_elements"""
+    expected = {
+        'header': {'count': 1, 'positions': [0], 'variants': set()},
+        'list': {'count': 1, 'positions': [1], 'variants': {'ul'}},
+        'code': {'count': 1, 'positions': [2], 'variants': {'python'}}
+    }
+
+    assert Markdown(MARKDOWN).md_elements == expected
+
+def test_md_elements_cached_across_instances():
+    """Test that md_elements of the same markdown is reused, but changes of one instance don't reach another"""
+    first = Markdown(MARKDOWN)
+    first.md_list[1]['list']['type'] = 'ol'
+    assert first.md_elements['list']['variants'] == {'ul'}
+    first.md_elements['code']['variants'].add('javascript')
+
+    second = Markdown(MARKDOWN)
+    assert second.md_elements['list']['variants'] == {'ul'}
+    assert second.md_elements['code']['variants'] == {'python'}
+    assert second.md_elements is second.md_elements
+    assert second._md_list is None
+
+def test_md_elements_cached_from_private_parse():
+    """Test that md_elements shared after classified_lines was handed out and changed are built from the text"""
+    markdown = MARKDOWN + '\nPrivate'
+    first = Markdown(markdown)
+    first.classified_lines[0] = {'p': 'changed', 'indent': 0}
+
+    assert first.md_list[0] == {'paragraph': 'changed'}
+    assert first.md_elements['header'] == {'count': 1, 'positions': [0], 'variants': set()}
+    assert Markdown(markdown).md_elements == first.md_elements
+
+def test_md_elements_positions_of_equal_elements():
+    """Test that equal elements get their own positions"""
+    md = Markdown('Text\n\n---\n\nText\n\n---')
+
+    assert md.md_elements['separator'] == {'count': 2, 'positions': [1, 3], 'variants': set()}
+    assert md.md_elements['paragraph']['positions'] == [0, 2]
+
+def test_outputs_parsed_once_per_instance(monkeypatch):
+    """Test that md_list, md_dict and the outputs built from them share a single parse"""
+    calls = []
+    merge = markdown_to_data.merge_classified_markdown_lines
+    monkeypatch.setattr(markdown_to_data, 'merge_classified_markdown_lines', lambda **kwargs: calls.append(1) or merge(**kwargs))
+
+    md = Markdown(MARKDOWN + '\nOnce')
+
+    assert md.md_list is md.md_list
+    assert md.md_dict is md.md_dict
+    md.md_elements
+    md.to_md()
+    assert len(calls) == 1
+
+def test_to_md_cached_per_arguments():
+    """Test that to_md output is reused for the same arguments only"""
+    md = Markdown(MARKDOWN)
+
+    assert md.to_md() is md.to_md()
+    assert md.to_md(include=['code']) == '```python\nprint("Hello")\n```'
+    assert md.to_md(exclude=['code']) == to_md_parser(md.md_list, exclude=['code'])
+    assert md.to_md(exclude=['code'], spacer=0) == to_md_parser(md.md_list, exclude=['code'], spacer=0)
+
+def test_to_md_round_trips_nested_task_list():
+    markdown = '- [x] done\n- open\n    - [ ] nested\n        - deeper\n- last'
+    assert Markdown(markdown).to_md() == markdown
+
+def test_outputs_follow_changes_to_md_list_and_md_dict():
+    """Test that to_md and to_json output built before md_list or md_dict is changed isn't returned afterwards"""
+    md = Markdown('# Title\n\nhello\n')
+    assert md.to_md() == '# Title\n\n\nhello'
+    md.md_list[0]['header']['content'] = 'Changed'
+    assert md.to_md() == '# Changed\n\n\nhello'
+
+    md = Markdown('# Title\n\nhello\n')
+    json_output = md.to_json()
+    md.md_dict['Title']['paragraph_1'] = 'changed'
+    assert md.to_json() != json_output
+    assert 'changed' in md.to_json()
+
+def test_string_outputs_cached_across_instances():
+    """Test that to_md and to_json output of the same markdown is reused without parsing again"""
+    first = Markdown(MARKDOWN)
+    md = first.to_md()
+    json_output = first.to_json(indent=2)
+
+    second = Markdown(MARKDOWN)
+    assert second.to_md() is md
+    assert second.to_json(indent=2) is json_output
+    assert second._md_list is None
+    assert second.to_json() != json_output
+
+def test_products_cache_from_several_threads():
+    """Test that instances of more texts than the cache holds can be parsed concurrently"""
+    texts = [f'# Header {i}\n\ntext {i}' for i in range(markdown_to_data._PRODUCTS_CACHE_SIZE * 3)] * 2
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = list(executor.map(lambda text: (Markdown(text).to_md(), Markdown(text).md_elements), texts))
+
+    for text, (md, md_elements) in zip(texts, outputs):
+        assert md == text.replace('\n\n', '\n\n\n')
+        assert md_elements['paragraph']['positions'] == [1]
+
+def test_extend():
+    """Test that extending the markdown chunk by chunk gives the same result as parsing it at once"""
+    md = Markdown('')
+    text = ''
+    for chunk in ['# Hea', 'der\n\n- item 1\n', '- item 2\n\n```py', 'thon\nprint("Hello")\n', '```\n']:
+        md.extend(chunk)
+        text += chunk
+        assert md.classified_lines == Markdown(text).classified_lines
+
+    expected = Markdown(MARKDOWN)
+    assert md.md_list == expected.md_list
+    assert md.md_dict == expected.md_dict
+    assert md.to_md() == expected.to_md()
+
+def test_extend_keeps_only_pending_text(monkeypatch):
+    """Test that classification keeps no text before the last incomplete line and extend adds no shared cache entries"""
+    calls = []
+    classify = markdown_to_data.classify_lines
+    monkeypatch.setattr(markdown_to_data, 'classify_lines', lambda *args, **kwargs: calls.append(1) or classify(*args, **kwargs))
+
+    cache_size = len(markdown_to_data._PRODUCTS_CACHE)
+    md = Markdown('')
+    for i in range(200):
+        md.extend(f'line {i}\n' * 50)
+        md.to_md()
+        md.md_elements
+    assert len(calls) == 400
+    assert md._pending_text == []
+
+    md.extend('more\n')
+    md.extend('last')
+    assert len(calls) == 400
+    assert md._pending_text == ['more\n', 'last']
+
+    assert len(md.classified_lines) == 10002
+    assert md._pending_text == ['last']
+    assert len(markdown_to_data._PRODUCTS_CACHE) == cache_size
+
+def test_weak_reference():
+    """Test that instances can be weakly referenced"""
+    md = Markdown(MARKDOWN)
+    assert weakref.ref(md)() is md
+
+def test_md_elements_none_variant():
+    """Test that code blocks without language add None to the variants"""
+    md = Markdown('```\nplain\n```\n\n```python\nprint("Hello")\n```\n\n1. item')
+
+    assert md.md_elements['code']['variants'] == {None, 'python'}
+    assert md.md_elements['list']['variants'] == {'ol'}
+
+def test_md_elements_empty_markdown():
+    """Test that markdown without elements has no md_elements entries"""
+    assert Markdown('').md_elements == {}
+    assert Markdown('  \n\n ').md_elements == {}
@@ -124,3 +124,15 @@ def test_empty_nested_items():
     }
     expected = "> Main content\n"
     assert blockquote_data_to_md(data) == expected
+
+def test_nesting_deeper_than_recursion_limit():
+    depth = 3000
+    item = {'content': f'Level {depth}', 'items': []}
+    for level in range(depth - 1, 0, -1):
+        item = {'content': f'Level {level}', 'items': [item]}
+
+    lines = blockquote_data_to_md({'blockquote': [item]}).splitlines()
+
+    assert len(lines) == depth
+    assert lines[0] == '> Level 1'
+    assert lines[-1] == '>' * depth + f' Level {depth}'
@@ -105,3 +105,12 @@ def test_none_content():
 
 ```"""
     assert code_data_to_md(data) == expected
+
+def test_non_string_language_and_content():
+    data = {
+        'code': {
+            'language': 3,
+            'content': 42
+        }
+    }
+    assert code_data_to_md(data) == "```3\n42\n```"
@@ -26,6 +26,11 @@ def test_with_whitespace_content():
     expected = "# Spaced Content\n"
     assert header_data_to_md(data) == expected
 
+def test_with_tabs_and_newlines_around_content():
+    data = {'header': {'level': 2, 'content': '\tTabbed Content\n'}}
+    expected = "## Tabbed Content\n"
+    assert header_data_to_md(data) == expected
+
 def test_with_invalid_level():
     data = {'header': {'level': 7, 'content': 'Invalid'}}
     expected = ""
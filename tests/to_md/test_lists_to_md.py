@@ -137,6 +137,29 @@ def test_mixed_nested_lists():
     )
     assert list_data_to_md(data) == expected
 
+def test_ordered_numbering_continues_after_nested_lists():
+    nested = [{'content': 'sub 1', 'items': [], 'task': None}, {'content': 'sub 2', 'items': [], 'task': None}]
+    data = {
+        'list': {
+            'type': 'ol',
+            'items': [
+                {'content': 'item 1', 'items': nested, 'task': None},
+                {'content': 'item 2', 'items': nested, 'task': None},
+                {'content': 'item 3', 'items': [], 'task': None}
+            ]
+        }
+    }
+    expected = (
+        "1. item 1\n"
+        "    1. sub 1\n"
+        "    2. sub 2\n"
+        "2. item 2\n"
+        "    1. sub 1\n"
+        "    2. sub 2\n"
+        "3. item 3"
+    )
+    assert list_data_to_md(data) == expected
+
 def test_empty_list():
     """Test conversion of an empty list."""
     data = {
@@ -207,3 +230,24 @@ def test_task_list_1():
     )
     result = list_data_to_md(data)
     assert result == expected
+
+def test_nesting_deeper_than_recursion_limit():
+    depth = 3000
+    item = {'content': f'Level {depth}', 'items': [], 'task': None}
+    for level in range(depth - 1, 0, -1):
+        item = {'content': f'Level {level}', 'items': [item], 'task': None}
+
+    lines = list_data_to_md({'list': {'type': 'ol', 'items': [item]}}).split('\n')
+
+    assert len(lines) == depth
+    assert lines[0] == '1. Level 1'
+    assert lines[-1] == '    ' * (depth - 1) + f'1. Level {depth}'
+
+def test_ordered_list_numbering_past_marker_table():
+    items = [{'content': f'Item {number}', 'items': [], 'task': None} for number in range(1, 1101)]
+
+    lines = list_data_to_md({'list': {'type': 'ol', 'items': items}}).split('\n')
+
+    assert len(lines) == 1100
+    assert lines[1022:1025] == ['1023. Item 1023', '1024. Item 1024', '1025. Item 1025']
+    assert lines[-1] == '1100. Item 1100'
@@ -107,3 +107,19 @@ def test_table_without_headers():
         "| Jane  | 30    | LA    |\n"
     )
     assert table_data_to_md(data) == expected
+
+def test_table_with_long_cell():
+    long_text = 'x' * 300
+    data = {
+        'table': {
+            'Name': ['short', long_text],
+            'Qty': [1, 2]
+        }
+    }
+    expected = (
+        f"| Name{' ' * 296} | Qty |\n"
+        f"|{'-' * 302}|-----|\n"
+        f"| short{' ' * 295} | 1   |\n"
+        f"| {long_text} | 2   |\n"
+    )
+    assert table_data_to_md(data) == expected
@@ -0,0 +1,28 @@
+import pytest
+from src.markdown_to_data.to_python.classification.md_classification.classify_md_blockquote import is_blockquote
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        # Single level
+        ("> quote", (True, {'blockquote': 'quote', 'level': 1})),
+        (">quote", (True, {'blockquote': 'quote', 'level': 1})),
+        ("   > indented quote", (True, {'blockquote': 'indented quote', 'level': 1})),
+        (">", (True, {'blockquote': '', 'level': 1})),
+
+        # Nested levels, with and without whitespace between the markers
+        (">> nested", (True, {'blockquote': 'nested', 'level': 2})),
+        ("> > nested", (True, {'blockquote': 'nested', 'level': 2})),
+        (">>  >\t> deep", (True, {'blockquote': 'deep', 'level': 4})),
+        ("> >", (True, {'blockquote': '', 'level': 2})),
+
+        # Markers after content are part of the content
+        ("> a > b", (True, {'blockquote': 'a > b', 'level': 1})),
+
+        # Not a blockquote
+        ("text > quote", (False, {})),
+        ("", (False, {})),
+    ]
+)
+def test_is_blockquote(line, expected):
+    assert is_blockquote(line) == expected
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from src.markdown_to_data.to_python.classification.md_classification.classify_md_table_row import is_table_row
 
 def test_basic_table():
@@ -253,3 +255,29 @@ def test_mixed_content_types():
         result.append(row_data)
 
     assert result == expected_output
+
+def test_many_pipes():
+    # Rows are split by pipes without any pattern matching, so long runs of pipes stay linear
+    is_table, row_data = is_table_row('|' * 10000)
+    assert not is_table
+    assert row_data == {}
+
+    is_table, row_data = is_table_row('| a ' * 1000 + '|')
+    assert is_table
+    assert len(row_data['tr']) == 1000
+    assert row_data['tr']['td_1000'] == 'a'
+
+    is_table, row_data = is_table_row('|' + ' |' * 1000 + '-|')
+    assert is_table
+    assert row_data == {'tr': 'table_separator', 'indent': 0}
+
+def test_rows_classified_concurrently():
+    """Test that rows of new widths classified from several threads get aligned cell keys"""
+    widths = [(width, is_header) for width in range(1100, 1140) for is_header in (False, True) for _ in range(2)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda args: is_table_row('| x ' * args[0] + '|', args[1]), widths))
+
+    for (width, is_header), (is_table, row_data) in zip(widths, results):
+        cell_type = 'th' if is_header else 'td'
+        assert is_table
+        assert list(row_data['tr']) == [f'{cell_type}_{i}' for i in range(1, width + 1)]
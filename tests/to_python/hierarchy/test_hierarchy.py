@@ -1,7 +1,7 @@
 import pytest
 from src.markdown_to_data.to_python.hierarchy.hierarchy import build_hierarchy_for_dict
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def basic_markdown_list():
     return [
         {
@@ -32,7 +32,7 @@ def basic_markdown_list():
         }
     ]
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def complex_markdown_list():
     return [
         {
@@ -231,3 +231,15 @@ def test_skip_levels():
 
     result = build_hierarchy_for_dict(input_list)
     assert result == expected
+
+def test_numbering_restarts_per_heading():
+    """Test that many elements of the same type are numbered in order, restarting under each heading"""
+    input_list = [{'paragraph': f'Intro {i}'} for i in range(1, 101)]
+    input_list.append({'header': {'level': 1, 'content': 'Title'}})
+    input_list.extend([{'paragraph': 'Text'}, {'list': 'List'}, {'paragraph': 'More text'}])
+
+    result = build_hierarchy_for_dict(input_list)
+
+    assert list(result)[:100] == [f'paragraph_{i}' for i in range(1, 101)]
+    assert result['paragraph_100'] == 'Intro 100'
+    assert result['Title'] == {'paragraph_1': 'Text', 'list_1': 'List', 'paragraph_2': 'More text'}
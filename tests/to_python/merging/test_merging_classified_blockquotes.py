@@ -206,3 +206,20 @@ def test_example_from_docstring():
     ]
 
     assert merge_blockquotes(input_data) == expected
+
+def test_deeply_nested_blockquote():
+    # Deeper than the recursion limit, as nesting levels are tracked without recursion
+    depth = 3000
+    input_data = [
+        {'blockquote': {'p': f'level {level}', 'indent': 0}, 'level': level}
+        for level in range(1, depth + 1)
+    ]
+
+    result = merge_blockquotes(input_data)
+
+    item = result[0]['blockquote'][0]
+    for level in range(2, depth + 1):
+        assert len(item['items']) == 1
+        item = item['items'][0]
+        assert item['content'] == f'level {level}'
+    assert item['items'] == []
@@ -250,3 +250,28 @@ def test_list_terminated_by_different_element():
     ]
 
     assert merge_lists(classified_list) == expected
+
+def test_deeply_nested_list():
+    """Test a list nested deeper than the recursion limit, as nesting levels are tracked without recursion."""
+    depth = 3000
+    classified_list = [
+        {
+            'ul': {
+                'li': {'p': f'level {level}', 'indent': 0},
+                'marker': '-',
+                'task': None
+            },
+            'item_indent': level * 2 + 2,
+            'marker_indent': level * 2
+        }
+        for level in range(depth)
+    ]
+
+    result = merge_lists(classified_list)
+
+    item = result[0]['list']['items'][0]
+    for level in range(1, depth):
+        assert len(item['items']) == 1
+        item = item['items'][0]
+        assert item['content'] == f'level {level}'
+    assert item['items'] == []
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from src.markdown_to_data.to_python.merging_multiline_objects.merge_table import merge_tables
 
 def test_basic_table_with_headers():
@@ -169,3 +171,70 @@ def test_table_with_mixed_types():
     ]
 
     assert merge_tables(input_data) == expected
+
+def test_table_with_only_separator():
+    """Test table segment consisting of a separator row only."""
+    input_data = [
+        {'tr': 'table_separator', 'indent': 0}
+    ]
+
+    expected = [
+        {
+            'table': {}
+        }
+    ]
+
+    assert merge_tables(input_data) == expected
+
+def test_table_with_duplicate_headers():
+    """Test table with duplicate headers sharing one column."""
+    input_data = [
+        {'tr': {'td_1': 'A', 'td_2': 'A', 'td_3': 'B'}, 'indent': 0},
+        {'tr': 'table_separator', 'indent': 0},
+        {'tr': {'td_1': 1, 'td_2': 2, 'td_3': 3}, 'indent': 0},
+        {'tr': {'td_1': 4, 'td_2': 5, 'td_3': 6}, 'indent': 0}
+    ]
+
+    expected = [
+        {
+            'table': {
+                'A': [1, 2, 4, 5],
+                'B': [3, 6]
+            }
+        }
+    ]
+
+    assert merge_tables(input_data) == expected
+
+def test_table_with_headers_only():
+    """Test table with header and separator but without data rows."""
+    input_data = [
+        {'tr': {'td_1': 'Name', 'td_2': 'Age'}, 'indent': 0},
+        {'tr': 'table_separator', 'indent': 0},
+        {'p': 'text', 'indent': 0}
+    ]
+
+    expected = [
+        {
+            'table': {
+                'Name': [],
+                'Age': []
+            }
+        },
+        {'p': 'text', 'indent': 0}
+    ]
+
+    assert merge_tables(input_data) == expected
+
+def test_tables_merged_concurrently():
+    """Test that tables of new widths merged from several threads keep their column names aligned."""
+    def merge_table_of_width(width):
+        row = {f'td_{i}': i for i in range(1, width + 1)}
+        return merge_tables([{'tr': row, 'indent': 0}])
+
+    widths = [width for width in range(300, 340) for _ in range(4)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(merge_table_of_width, widths))
+
+    for width, result in zip(widths, results):
+        assert result == [{'table': {f'col_{i}': [i] for i in range(1, width + 1)}}]
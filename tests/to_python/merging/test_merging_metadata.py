@@ -231,3 +231,100 @@ def test_malformed_metadata():
     ]
 
     assert merge_metadata(input_data) == expected
+
+def test_only_first_metadata_block():
+    """Test that only the metadata block at the start is merged and the rest is kept as is"""
+    input_data = [
+        {'separator': '---'},
+        {'paragraph': 'title: First'},
+        {'separator': '---'},
+        {'paragraph': ''},
+        {'separator': '---'},
+        {'paragraph': 'title: Second'},
+        {'separator': '---'}
+    ]
+
+    expected = [
+        {
+            'metadata': {
+                'title': 'First'
+            }
+        },
+        {'paragraph': ''},
+        {'separator': '---'},
+        {'paragraph': 'title: Second'},
+        {'separator': '---'}
+    ]
+
+    assert merge_metadata(input_data) == expected
+
+def test_metadata_scan_stops_at_non_paragraph():
+    """Test that an unclosed metadata block is left unchanged once a non-paragraph element follows"""
+    input_data = [
+        {'separator': '---'},
+        {'paragraph': 'title: Test Document'},
+        {'header': {'level': 1, 'content': 'Header'}},
+        {'separator': '---'}
+    ]
+
+    assert merge_metadata(input_data) == input_data
+
+def test_metadata_with_colons_in_values():
+    """Test that only the first colon separates key and value"""
+    input_data = [
+        {'separator': '---'},
+        {'paragraph': 'title: Understanding Time: A Brief History'},
+        {'paragraph': 'time: 12:30'},
+        {'separator': '---'}
+    ]
+
+    expected = [
+        {
+            'metadata': {
+                'title': 'Understanding Time: A Brief History',
+                'time': '12:30'
+            }
+        }
+    ]
+
+    assert merge_metadata(input_data) == expected
+
+def test_metadata_with_unclosed_quotes_in_lists():
+    """Test that an unclosed quote in a list value drops the rest of the value"""
+    input_data = [
+        {'separator': '---'},
+        {'paragraph': 'tags: [python, "web, development", testing, "open, end]'},
+        {'paragraph': "authors: John, 'Jane Doe', 'Smith"},
+        {'separator': '---'}
+    ]
+
+    expected = [
+        {
+            'metadata': {
+                'tags': ['python', 'web, development', 'testing'],
+                'authors': ['John', 'Jane Doe']
+            }
+        }
+    ]
+
+    assert merge_metadata(input_data) == expected
+
+def test_metadata_keys_with_whitespace_runs():
+    """Test that runs of whitespace in keys become a single underscore"""
+    input_data = [
+        {'separator': '---'},
+        {'paragraph': 'last    modified: 2024-01-15'},
+        {'paragraph': 'created\t by : John Doe'},
+        {'separator': '---'}
+    ]
+
+    expected = [
+        {
+            'metadata': {
+                'last_modified': '2024-01-15',
+                'created_by': 'John Doe'
+            }
+        }
+    ]
+
+    assert merge_metadata(input_data) == expected